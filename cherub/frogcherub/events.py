@@ -1,5 +1,6 @@
+import sys
 import uuid
-from typing import Optional, Dict, List, Set, Union
+from typing import Optional, Dict, List, Set, Tuple, Union
 from .format import pretty_sequence
 
 
@@ -108,7 +109,8 @@ class Citation:
         if type not in Citation.types:
             raise ValueError("invalid citation type; must be one of: {!r}".format(Citation.types))
             
-        self._type = type
+        # type is compared against literals every time a citation is shown
+        self._type = sys.intern(type)
         self._work = kwargs.get('work', 'homestuck')
         self._panel = 0
         self._line = 0
@@ -353,7 +355,7 @@ class Constraint:
         'narrative_entrypoint',
         'narrative_jump',
         'narrative_causal',
-        'narrative_immediate'
+        'narrative_immediate',
         'absolute',
         'relative',
         'causal',
@@ -640,12 +642,34 @@ class Tag:
         "item_split"
     ]
 
+    @classmethod
+    def char_enters(cls, character: str, location: str) -> 'Tag':
+        """
+        Create a char_enters_location tag. Same as Tag("char_enters_location", character=character,
+        location=location), but skips the type check and keyword parsing since one of these is added for every
+        move.
+        """
+        tag = cls.__new__(cls)
+        tag._init_fields("char_enters_location")
+        tag._actor = str(character)
+        tag._location = location
+        return tag
+
+    @classmethod
+    def char_exits(cls, character: str, location: str) -> 'Tag':
+        """
+        Create a char_exits_location tag. Same as Tag("char_exits_location", character=character,
+        location=location), but skips the type check and keyword parsing since one of these is added for every
+        move.
+        """
+        tag = cls.__new__(cls)
+        tag._init_fields("char_exits_location")
+        tag._actor = str(character)
+        tag._location = location
+        return tag
+
     # noinspection PyShadowingBuiltins
-    def __init__(self, type: str, **kwargs):
-        type = type.lower()
-        if type not in Tag.types:
-            raise ValueError("invalid tag type; must be one of: {!r}".format(Tag.types))
-            
+    def _init_fields(self, type: str):
         self._type = type
         self._actor = ""
         self._target = ""
@@ -659,6 +683,16 @@ class Tag:
         self._source_items = []
         self._result_items = []
         self._results_in_sylladex = []
+
+    # noinspection PyShadowingBuiltins
+    def __init__(self, type: str, **kwargs):
+        # lower() gives a fresh string; interning it lets the type checks below and
+        # every later comparison against a literal match by identity
+        type = sys.intern(type.lower())
+        if type not in Tag.types:
+            raise ValueError("invalid tag type; must be one of: {!r}".format(Tag.types))
+            
+        self._init_fields(type)
         
         if self.type == 'appearance_changed':
             if 'recipient' in kwargs:
@@ -1325,24 +1359,34 @@ class Timeline:
                 return idx
         return -1
 
-    def has_location(self, location: str, index: int = -1) -> bool:
-        """Return whether a location with the given properties is present.
+    def find_location(self, location: str, index: int = -1) -> Optional[Tuple[int, Location]]:
+        """Find a location with the given properties along with its index.
 
         :param location: The name of the location to match. If left blank, only 'index' is used for matching.
         :param index: The index of the location to check for. If left blank, only 'location' is used for matching.
-        :return: Whether the given locations is present.
+        :return: The index and the location, or None if it is not present.
         """
         if index >= 0:
             if index >= len(self.locations):
-                return False
-            if location != "":
-                return self.locations[index].path == location
-            return True
+                return None
+            loc = self.locations[index]
+            if location != "" and loc.path != location:
+                return None
+            return index, loc
         else:
-            for loc in self.locations:
+            for idx, loc in enumerate(self.locations):
                 if loc.path == location:
-                    return True
-            return False
+                    return idx, loc
+            return None
+
+    def has_location(self, location: str, index: int = -1) -> bool:
+        """Return whether a location with the given properties is present.
+
+        :param location: The name of the location to match. If left blank, only 'index' is used for matching.
+        :param index: The index of the location to check for. If left blank, only 'location' is used for matching.
+        :return: Whether the given locations is present.
+        """
+        return self.find_location(location, index) is not None
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Timeline):
@@ -1430,24 +1474,34 @@ class Universe:
                 return idx
         return -1
 
-    def has_timeline(self, timeline: str, index: int = -1) -> bool:
-        """Return whether a timeline with the given properties is present.
+    def find_timeline(self, timeline: str, index: int = -1) -> Optional[Tuple[int, Timeline]]:
+        """Find a timeline with the given properties along with its index.
 
         :param timeline: The name of the timeline to match. If left blank, only 'index' is used for matching.
         :param index: The index of the timeline to check for. If left blank, only 'timeline' is used for matching.
-        :return: Whether the given timeline is present.
+        :return: The index and the timeline, or None if it is not present.
         """
         if index >= 0:
             if index >= len(self.timelines):
-                return False
-            if timeline != "":
-                return self.timelines[index].path == timeline
-            return True
+                return None
+            t = self.timelines[index]
+            if timeline != "" and t.path != timeline:
+                return None
+            return index, t
         else:
-            for t in self.timelines:
+            for idx, t in enumerate(self.timelines):
                 if t.path == timeline:
-                    return True
-            return False
+                    return idx, t
+            return None
+
+    def has_timeline(self, timeline: str, index: int = -1) -> bool:
+        """Return whether a timeline with the given properties is present.
+
+        :param timeline: The name of the timeline to match. If left blank, only 'index' is used for matching.
+        :param index: The index of the timeline to check for. If left blank, only 'timeline' is used for matching.
+        :return: Whether the given timeline is present.
+        """
+        return self.find_timeline(timeline, index) is not None
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, Universe):
@@ -1627,22 +1681,20 @@ class Event:
         Find the location of the given item
         """
         
-        address = None
         for u_idx, u in enumerate(self.universes):
             for tl_idx, tl in enumerate(u.timelines):
                 for loc_idx, loc in enumerate(tl.locations):
                     if item_or_char in loc.characters or item_or_char in loc.items:
-                        address = ParadoxAddress(location=loc.path, timeline=tl.path, universe=u.name)
-                        address.location_index = loc_idx
-                        address.timeline_index = tl_idx
-                        address.universe_index = u_idx
-                        break
-                if address is not None:
-                    break
-            if address is not None:
-                break
+                        return ParadoxAddress(
+                            location=loc.path,
+                            timeline=tl.path,
+                            universe=u.name,
+                            location_index=loc_idx,
+                            timeline_index=tl_idx,
+                            universe_index=u_idx
+                        )
                 
-        return address
+        return None
         
     def get_universe(self, address: ParadoxAddress) -> Optional[Universe]:
         """
@@ -1673,17 +1725,27 @@ class Event:
 
         :return: Whether the given Universe is present in this event.
         """
+        return self.find_universe(address) is not None
+
+    def find_universe(self, address: ParadoxAddress) -> Optional[Tuple[int, Universe]]:
+        """
+        Find a universe in this Event along with its index. The address is matched the same way as in
+        has_universe().
+
+        :return: The index and the universe, or None if it is not present.
+        """
         if address.universe_index >= 0:
             if address.universe_index >= len(self.universes):
-                return False
-            if address.universe != "":
-                return self.universes[address.universe_index].name == address.universe
-            return True
+                return None
+            u = self.universes[address.universe_index]
+            if address.universe != "" and u.name != address.universe:
+                return None
+            return address.universe_index, u
         else:
-            for u in self.universes:
+            for idx, u in enumerate(self.universes):
                 if u.name == address.universe:
-                    return True
-            return False
+                    return idx, u
+            return None
 
     def index_of_universe(self, univ: Union[ParadoxAddress, str]) -> int:
         """Return the index of the given universe.
@@ -1724,16 +1786,23 @@ class Event:
 
         :return: Whether the given Timeline is present in this event.
         """
+        return self.find_timeline(address) is not None
+
+    def find_timeline(self, address: ParadoxAddress) -> Optional[Tuple[int, Timeline]]:
+        """
+        Find a timeline in this Event along with its index within its universe. The address is matched the same way
+        as in has_timeline().
+
+        :return: The index and the timeline, or None if it is not present.
+        """
         if address.universe == "" and address.universe_index == -1:
             address = address.copy()
             address.universe_index = 0
 
-        univ = self.get_universe(address)
-        if univ is None:
-            return False
-        if address.universe != "" and univ.name != address.universe:
-            return False
-        return univ.has_timeline(address.timeline, address.timeline_index)
+        found = self.find_universe(address)
+        if found is None:
+            return None
+        return found[1].find_timeline(address.timeline, address.timeline_index)
         
     def get_location(self, address: ParadoxAddress) -> Optional[Location]:
         """
@@ -1760,16 +1829,23 @@ class Event:
 
         :return: Whether the given Location is present in this event.
         """
+        return self.find_location(address) is not None
+
+    def find_location(self, address: ParadoxAddress) -> Optional[Tuple[int, Location]]:
+        """
+        Find a location in this Event along with its index within its timeline. The address is matched the same way
+        as in has_location().
+
+        :return: The index and the location, or None if it is not present.
+        """
         if address.timeline == "" and address.timeline_index == -1:
             address = address.copy()
             address.timeline_index = 0
 
-        t = self.get_timeline(address)
-        if t is None:
-            return False
-        if address.timeline != "" and t.path != address.timeline:
-            return False
-        return t.has_location(address.location, address.location_index)
+        found = self.find_timeline(address)
+        if found is None:
+            return None
+        return found[1].find_location(address.location, address.location_index)
 
     def copy(self) -> 'Event':
         return Event.from_dict(self.to_dict())
@@ -36,6 +36,10 @@ def pretty_sequence(name: str, seq, tab_level: int = 0) -> str:
 
 
 def remove_ansi_escapes(s: str) -> str:
+    # almost all input has no escape sequences at all; checking for the ESC char
+    # is much cheaper than running the regex over it.
+    if '\x1B' not in s:
+        return s
     return _ansi_escape_re.sub('', s)
 
 
@@ -67,31 +71,13 @@ def wrap(s: str, width: int, extend: bool = False) -> str:
 
     existing_blocks = s.split('\n')
 
-    completed_block_lines = list()
-    for block in existing_blocks:
-        lines = list()
-
-        # edge case - if we are operating on a blank block, we need to manually set it as having
-        # its lines because the following algo would produce zero result lines
-        if block == "":
-            completed_block_lines.append('')
-            continue
-
-        cur_word = cur_line = ""
-        for ch in block:
-            if ch == ' ':
-                cur_line = _append_word_to_line(lines, cur_word, cur_line, width)
-                cur_word = ""
-            else:
-                cur_word += ch
-
-        if cur_word != "":
-            cur_line = _append_word_to_line(lines, cur_word, cur_line, width)
-
-        if cur_line != "":
-            lines.append(cur_line)
-
-        completed_block_lines.extend(lines)
+    # most text given to wrap already fits. if no line is too long and none has
+    # a leading or trailing space for the word walk to drop, it would come out
+    # the same, so skip it
+    if all(len(block) <= width and block[:1] != ' ' and block[-1:] != ' ' for block in existing_blocks):
+        completed_block_lines = existing_blocks
+    else:
+        completed_block_lines = _wrap_blocks(existing_blocks, width)
         
     if extend:
         for i, _ in enumerate(completed_block_lines):
@@ -180,6 +166,35 @@ def columns(
     return '\n'.join(finished_lines)        
         
 
+def _wrap_blocks(blocks: List[str], width: int) -> List[str]:
+    completed_block_lines = list()
+    for block in blocks:
+        lines = list()
+
+        # edge case - if we are operating on a blank block, we need to manually set it as having
+        # its lines because the following algo would produce zero result lines
+        if block == "":
+            completed_block_lines.append('')
+            continue
+
+        # split on spaces in one call rather than walking the block a character
+        # at a time; every word but the last was followed by a space.
+        words = block.split(' ')
+        cur_line = ""
+        for word in words[:-1]:
+            cur_line = _append_word_to_line(lines, word, cur_line, width)
+
+        if words[-1] != "":
+            cur_line = _append_word_to_line(lines, words[-1], cur_line, width)
+
+        if cur_line != "":
+            lines.append(cur_line)
+
+        completed_block_lines.extend(lines)
+
+    return completed_block_lines
+
+
 def _append_word_to_line(lines: List[str], word: str, line: str, width: int) -> str:
     # any width less than 2 is not possible and will result in an infinite loop,
     # as at least one character is required for next in word, and one character for
@@ -1,5 +1,5 @@
 import re
-from typing import Optional, Callable, Any, Tuple, Dict, List
+from typing import Optional, Callable, Any, Tuple, Dict, List, Iterator
 import uuid
 
 from . import entry
@@ -67,6 +67,8 @@ class Form:
         put through the type_conv function, so it should be the exact type that is desired for
         the field. Alternatively, this can be a Callable that takes no arguments and produces
         a value; in this case, it will be called for the default value every time one is needed.
+        If calling it produces an iterator (such as when it is a generator function), it is
+        only called once and each later default is the next item from that iterator.
         :param nullable: Whether the field can be set to null.
         :param multivalue: Marks the field as multivalued (list-valued). When set to
         True, then during form filling the user is prompted for multiple values for this field
@@ -106,6 +108,7 @@ class Form:
             'name': name,
             'type': type,
             'default': default,
+            'default_iter': None,
             'nullable': nullable,
             'multivalue': multivalue,
             'sentinel': sentinel,
@@ -432,8 +435,14 @@ class Form:
             sentinel = f['sentinel']
             got_valid = False
             default_value = f['default']
-            if default_value is not None and callable(default_value):
+            if f['default_iter'] is not None:
+                default_value = next(f['default_iter'], None)
+            elif default_value is not None and callable(default_value):
                 default_value = default_value()
+                if isinstance(default_value, Iterator):
+                    # bind the iterator so later defaults just advance it
+                    f['default_iter'] = default_value
+                    default_value = next(default_value, None)
             while not got_valid:
                 if self._in_multivalue:
                     full_path += "[" + str(self._multivalue_index) + "]"
@@ -486,6 +495,7 @@ class Form:
             # we now have a valid task, have it set as default if that is what we do
             if f['default_last_entered']:
                 f['default'] = value
+                f['default_iter'] = None
             return path_comps, value
         elif f['field_type'] == 'object':
             subform = f['form']
@@ -1,3 +1,5 @@
+from typing import Any, Callable
+import functools
 import json
 
 from .format import remove_ansi_escapes
@@ -43,31 +45,45 @@ def custom(dataset) -> int:
         
         mutie = input("MUTATE> ")
         mutie = remove_ansi_escapes(mutie)
-        if query == r'\q':
+        if mutie == r'\q':
             running = False
             continue
-        elif query == r'\c':
+        elif mutie == r'\c':
             continue
             
-        mutation_func_str = 'lambda _: ' + mutie
-        mutation_func = eval(mutation_func_str)
+        mutation_func = _compile_mutation(mutie)
+        updated_results = list()
+        updated = 0
         for m in matches:
             old_val = m.value
             new_val = mutation_func(old_val)
             print("NEW VAL: {!r}".format(new_val))
+            updated_results.append(new_val)
+            
+            # no need to walk the path again if the value didn't actually change
+            if type(new_val) is type(old_val) and new_val == old_val:
+                continue
             dataset = m.full_path.update(dataset, new_val)
+            updated += 1
             
-        # show user the result by selecting the updated data once more
-        updated_matches = expr.find(dataset)
-        if len(updated_matches) < 1:
-            raise ValueError("updated_matches somehow resulted in no results")
-        updated_results = [m.value for m in updated_matches]
+        # show user the result. the new values are exactly what was written, so
+        # there's no need to run the query again to get them
         updated_output = json.dumps(updated_results, indent=2, sort_keys=True)
-        print(output)
+        print(updated_output)
            
-        print("{!r} row(s) updated with mutation lambda".format(len(matches)))
-        total_updated += len(matches)
+        print("{!r} row(s) updated with mutation lambda".format(updated))
+        total_updated += updated
     return total_updated
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_mutation(mutie: str) -> Callable[[Any], Any]:
+    """
+    Compile the body of a mutation lambda into a function. Re-entering the same
+    mutation reuses the function compiled the first time.
+    """
+    code = compile('lambda _: ' + mutie, '<mutation>', 'eval')
+    return eval(code)
         
 
 def universe_collapse(dataset) -> int:
@@ -75,101 +91,61 @@ def universe_collapse(dataset) -> int:
     
     for event in dataset['events']:
         univs = event['universes']
-        new_univs = {}
-        needs_updating = False
         
+        # only old-style entries (one per location, with the characters directly
+        # on them) need collapsing
+        if not any('characters' in u for u in univs):
+            continue
+            
+        # universe name -> timeline path -> location path -> collapsed location
+        # along with the sets of characters and items already added to it. dicts
+        # keep insertion order, so everyfin comes out in the order first seen.
+        new_univs = {}
         for u in univs:
+            new_tls = new_univs.setdefault(u['name'], {})
             if 'characters' in u:
-                needs_updating = True
-                break
-                
-        if needs_updating:
-            for u in univs:
-                if 'characters' in u:
-                    if u['name'] not in new_univs:
-                        new_univs[u['name']] = {
-                            "name": u['name'],
-                            "timelines": {}
-                        }    
-                    new_univ = new_univs[u['name']]
-                    
-                    if u['timeline'] not in new_univ['timelines']:
-                        new_univ['timelines'][u['timeline']] = {
-                            "path": u['timeline'],
-                            "locations": {}
-                        }
-                    new_tl = new_univ['timelines'][u['timeline']]
-                    
-                    if u['location'] not in new_tl['locations']:
-                        new_tl['locations'][u['location']] = {
-                            "path": u['location'],
-                            "characters": [],
-                            "items": []
-                        }
-                    new_loc = new_tl['locations'][u['location']]
-                    
-                    for ch in u['characters']:
-                        if ch not in new_loc['characters']:
-                            new_loc['characters'].append(ch)
-                            
-                    for item in u['items']:
-                        if item not in new_loc['items']:
-                            new_loc['items'].append(item)
-
-                else:
-                    if u['name'] not in new_univs:
-                        new_univs[u['name']] = {
-                            "name": u['name'],
-                            "timelines": {}
-                        }    
-                    new_univ = new_univs[u['name']]
-                    
-                    for tl in u['timelines']:
-                        if tl['path'] not in new_univ['timelines']:
-                            new_univ['timelines'][tl['path']] = {
-                                "path": tl['path'],
-                                "locations": {}
-                            }
-                        new_tl = new_univ['timelines'][tl['path']]
-                        
-                        for loc in tl['locations']:
-                            if loc['path'] not in new_tl['locations']:
-                                new_tl['locations'][loc['path']] = {
-                                    "path": loc['path'],
-                                    "characters": [],
-                                    "items": []
-                                }
-                            new_loc = new_tl['locations'][loc['path']]
-                            
-                            for ch in loc['characters']:
-                                if ch not in new_loc['characters']:
-                                    new_loc['characters'].append(ch)
-                                    
-                            for item in loc['items']:
-                                if item not in new_loc['items']:
-                                    new_loc['items'].append(item)
-            
-            # now convert it into actual proper format
-            formatted_new_univs = []
-            for u_name in new_univs:
-                u = new_univs[u_name]
-                formatted_univ = {
-                    "name": u_name,
-                    "timelines": []
-                }
-                for tl_path in u['timelines']:
-                    tl = u['timelines'][tl_path]
-                    formatted_tl = {
+                new_locs = new_tls.setdefault(u['timeline'], {})
+                _collapse_location(new_locs, u['location'], u['characters'], u['items'])
+            else:
+                for tl in u['timelines']:
+                    new_locs = new_tls.setdefault(tl['path'], {})
+                    for loc in tl['locations']:
+                        _collapse_location(new_locs, loc['path'], loc['characters'], loc['items'])
+        
+        # now convert it into actual proper format and assign it
+        event['universes'] = [
+            {
+                "name": u_name,
+                "timelines": [
+                    {
                         "path": tl_path,
-                        "locations": []
+                        "locations": [loc for loc, _, _ in new_locs.values()]
                     }
-                    for loc_path in tl['locations']:
-                        loc = tl['locations'][loc_path]
-                        formatted_tl['locations'].append(loc)
-                    formatted_univ['timelines'].append(formatted_tl)
-                formatted_new_univs.append(formatted_univ)
-                
-            # and assign it
-            event['universes'] = formatted_new_univs
-            modified_count += 1
+                    for tl_path, new_locs in new_tls.items()
+                ]
+            }
+            for u_name, new_tls in new_univs.items()
+        ]
+        modified_count += 1
     return modified_count
+
+
+def _collapse_location(new_locs: dict, path: str, characters: list, items: list):
+    if path not in new_locs:
+        new_loc = {
+            "path": path,
+            "characters": [],
+            "items": []
+        }
+        new_locs[path] = (new_loc, set(), set())
+    new_loc, seen_chars, seen_items = new_locs[path]
+    
+    _extend_unique(new_loc['characters'], seen_chars, characters)
+    _extend_unique(new_loc['items'], seen_items, items)
+
+
+def _extend_unique(dest: list, seen: set, values):
+    for v in values:
+        if v not in seen:
+            seen.add(v)
+            dest.append(v)
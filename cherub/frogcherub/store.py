@@ -1,10 +1,14 @@
-from typing import Callable, Optional, Any, Union, List, Dict
-import re
+from typing import Callable, Optional, Any, Union, List, Dict, Iterator, Iterable
+import functools
+import itertools
+import keyword
+import operator
+import sys
 
 SerializedPrimitive = Optional[Union[int, str, float, bool]]
 SerializedValue = Union[SerializedPrimitive, List['SerializedValue'], Dict[str, 'SerializedValue']]
 SerializationVersion = 1
-WhereClause = Optional[Callable[[Dict[str, Any]], bool]]
+WhereClause = Optional[Union[str, Callable[[Dict[str, Any]], bool]]]
 
 FieldValue = SerializedPrimitive
 Row = Dict[str, FieldValue]
@@ -17,18 +21,46 @@ _field_types = {
 }
 
 
+def _is_identifier(name: str) -> bool:
+    # names must be usable in string where clauses, which are evaluated as Python
+    return name.isascii() and name.isidentifier() and not keyword.iskeyword(name)
 
 
 class FieldDef:
+    """
+    Definition of a single field in a Model.
+
+    FieldDefs are shared between every Model that uses the same name, type, and
+    default (see _make_fielddef), so they cannot be changed once created.
+    """
+    __slots__ = ('name', '_type_name', 'type', 'default')
+
     def __init__(self, name: str, type: str = "str", default: Any = None):
-        if type not in _field_types:
+        type_conv = _field_types.get(type)
+        if type_conv is None:
             raise ValueError("{!r} is not a valid field type".format(str(type)))
-        if _identifier_re.match(name) is None:
+        if not _is_identifier(name):
             raise ValueError("{!r} is not a valid identifier".format(str(name)))
-        self.name = name
-        self._type_name = type
-        self.type = _field_types[type]
-        self.default = None if default is None else self.type(default)
+        # names are used as the keys of every row, so intern them to let key
+        # lookups compare by identity
+        object.__setattr__(self, 'name', sys.intern(name))
+        object.__setattr__(self, '_type_name', type)
+        object.__setattr__(self, 'type', type_conv)
+        object.__setattr__(self, 'default', None if default is None else type_conv(default))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FieldDef is shared between models and cannot be changed")
+
+    def __copy__(self) -> 'FieldDef':
+        return self
+
+    def __deepcopy__(self, memo) -> 'FieldDef':
+        return self
+
+    def __reduce__(self):
+        # __setattr__ refuses the default unpickling path, so rebuild through the
+        # shared cache instead
+        return _make_fielddef, (self.name, self._type_name, self.default)
         
     def to_dict(self) -> Dict[str, SerializedValue]:
         d = {
@@ -42,7 +74,8 @@ class FieldDef:
         return d
         
     def copy(self) -> 'FieldDef':
-        return FieldDef(self.name, self.type, self.default)
+        # FieldDefs are immutable and shared, so there is nothing to copy.
+        return self
     
     @staticmethod
     def from_dict(d: dict) -> 'FieldDef':
@@ -59,32 +92,54 @@ class FieldDef:
         if d['default'] is not None:
             default = str(d['default'])
         
-        fd = FieldDef(name, type_conv, default)
+        fd = _make_fielddef(name, type_conv, default)
         return fd
 
 
+def _make_fielddef(name: str, type_name: str, default: Any) -> FieldDef:
+    """
+    Return the shared FieldDef for the given name, type, and default, creating it
+    only if one has not already been created.
+
+    The default is converted to the field type before it is used as part of the
+    key, so defaults that are equal but convert differently (such as 1, 1.0, and
+    True for a str field) each get their own FieldDef.
+    """
+    type_conv = _field_types.get(type_name)
+    if type_conv is None:
+        # FieldDef reports the bad type
+        return FieldDef(name, type_name, default)
+    if default is not None:
+        default = type_conv(default)
+    return _shared_fielddef(name, type_name, default)
+
+
+@functools.lru_cache(maxsize=4096)
+def _shared_fielddef(name: str, type_name: str, default: FieldValue) -> FieldDef:
+    return FieldDef(name, type_name, default)
+
+
 class Model:
+    __slots__ = ('fields',)
+
     def __init__(self):
         self.fields = {}
         
     def to_dict(self) -> Dict[str, SerializedValue]:
-        d = {"fields": list()}
-        for f in self:
-            d['fields'].append(self[f].to_dict())
-            
+        d = {"fields": [f.to_dict() for f in self.fields.values()]}
         return d
         
     def copy(self) -> 'Model':
+        # FieldDefs are immutable, so a shallow copy of the dict is a full copy.
         m = Model()
-        for f in self.fields:
-            m.fields[f] = self.fields[f].copy()
+        m.fields = dict(self.fields)
         return m
         
-    def add_field(self, name: str, type_conv: Optional[Callable[[Any], Any]] = None, default: Any = None):
+    def add_field(self, name: str, type: str = "str", default: Any = None):
         if name in self.fields:
             raise ValueError("field named {!r} already exists".format(name))
-        new_field = FieldDef(name, type_conv, default)
-        self.fields[name] = new_field
+        new_field = _make_fielddef(name, type, default)
+        self.fields[new_field.name] = new_field
         
     @staticmethod
     def from_dict(d: dict) -> 'Model':
@@ -104,21 +159,41 @@ class Model:
             
         return m
         
+    def __getitem__(self, key) -> FieldDef:
+        return self.fields[key]
+        
+    def __len__(self):
+        return len(self.fields)
+        
+    def __iter__(self):
+        return iter(self.fields)
+        
+    def __contains__(self, item):
+        return item in self.fields
+        
         
 class FlexibleSchema:
     """
     It's flexible because you can add fields after data is present.
+    
+    Data is stored by column rather than by row; each field in the model has a
+    list holding its value for every row. Row dicts are only built when rows are
+    handed back to the caller or given to a where clause.
     """
+    __slots__ = ('name', '_columns', '_n', '_model')
     
     def __init__(self, name: str, model: Optional[Model] = None):
         if model is None:
             model = Model()
         
-        if _identifier_re.match(name) is None:
+        if not _is_identifier(name):
             raise ValueError("{!r} is not a valid identifier".format(str(name)))
         self.name = name
-        self.rows: List[Dict[str, FieldValue]] = []
-        self._model = model
+        # keep our own copy, as alter() does, so that fields added to the
+        # caller's model later can't get out of step with the columns
+        self._model = model.copy()
+        self._columns: Dict[str, List[FieldValue]] = {f: [] for f in model.fields}
+        self._n = 0
         
     def to_dict(self) -> Dict[str, SerializedValue]:
         d = {
@@ -155,8 +230,7 @@ class FlexibleSchema:
         fs = FlexibleSchema(name, model)
         
         # now add the rows via insert so that they are checked
-        for r in d['data']:
-            self.insert(r)
+        fs.insert_many(d['data'])
             
         return fs
     
@@ -164,6 +238,17 @@ class FlexibleSchema:
     def model(self) -> Model:
         return self._model.copy()
         
+    @property
+    def rows(self) -> List[Row]:
+        """
+        All rows in the schema. These are built from the column data on every
+        access, so modifying them does not modify the schema.
+        """
+        return list(self._iter_rows())
+        
+    def __len__(self):
+        return self._n
+        
     def alter(self, new_model: Model):
         """
         Alter the model and update every single row to match.
@@ -176,41 +261,68 @@ class FlexibleSchema:
         add_cols = dict()
         new_type_cols = list()
         
-        for f in self._model:
-            if f not in new_model:
+        old_fields = self._model.fields
+        new_fields = new_model.fields
+        for f in old_fields:
+            new_field = new_fields.get(f)
+            if new_field is None:
                 drop_cols.append(f)
-            elif hash(new_model[f].type) != hash(self._model[f].type):
+            elif new_field.type is not old_fields[f].type:
                 new_type_cols.append(f)
-        for f in new_model:
-            if f not in self._model:
-                add_cols[f] = new_model[f].default
+        for f in new_fields:
+            if f not in old_fields:
+                add_cols[f] = new_fields[f].default
                 
-        # now apply to each existing row
-        for r in self.rows:
-            for col in new_type_cols:
-                r[col] = model[col].type(str(r[col]))
-            for col in drop_cols:
-                del r[col]
-            for col in add_col:
-                r[col] = model[col].default
+        # now apply to each existing column
+        for col in new_type_cols:
+            type_conv = _value_converter(new_model.fields[col])
+            self._columns[col] = [None if v is None else type_conv(str(v)) for v in self._columns[col]]
+        for col in drop_cols:
+            del self._columns[col]
+        for col in add_cols:
+            self._columns[col] = [add_cols[col]] * self._n
+            
+        # keep the columns in the same order as the fields of the model
+        self._columns = {f: self._columns[f] for f in new_model.fields}
                 
         # and set the new model
-        self._model = model
-            
+        self._model = new_model.copy()
         
     def insert(self, row: Row):
-        full_row = {}
-        for f in self._model:
-            field = self._model[f]
-            full_row[field.name] = field.default
-        
-        for col in row:
-            if col not in self._model:
-                raise ValueError("no field named {!r} exists in this schema. Add to model first.")
-            field = self._model[col]
-            full_row[col] = field.type_conv(row[col])
+        self.insert_many([row])
+        
+    def insert_many(self, rows: Iterable[Row]) -> int:
+        """
+        Insert all of the given rows. If any row is invalid, none of them are
+        inserted.
+        
+        returns the number of rows inserted.
+        """
+        fields = list(self._model.fields.values())
+        convs = [_value_converter(f) for f in fields]
+        model_keys = self._model.fields.keys()
+        new_values = [list() for _ in fields]
+        
+        count = 0
+        for row in rows:
+            unknown = row.keys() - model_keys
+            if len(unknown) > 0:
+                raise ValueError("no field named {!r} exists in this schema. Add to model first.".format(unknown.pop()))
+                
+            for field, conv, values in zip(fields, convs, new_values):
+                if field.name not in row:
+                    values.append(field.default)
+                elif row[field.name] is None:
+                    values.append(None)
+                else:
+                    values.append(conv(row[field.name]))
+            count += 1
             
-        self.rows.append(full_row)
+        for col, values in zip(self._columns.values(), new_values):
+            col.extend(values)
+        self._n += count
+        
+        return count
             
     def select(self, where: WhereClause = None) -> List[Row]:
         """
@@ -219,14 +331,21 @@ class FlexibleSchema:
         returns the rows selected.
         """
         if where is None:
-            where = lambda r: True
+            return self.rows
+        where = _where_func(where)
+        return list(filter(where, self._iter_rows()))
+        
+    def select_by(self, column: str, predicate: Callable[[FieldValue], bool]) -> List[Row]:
+        """
+        Select rows whose value in a single column matches the predicate. Only that
+        column is scanned, and rows are only built for the ones that match.
+        
+        returns the rows selected.
+        """
+        if column not in self._columns:
+            raise ValueError("no field named {!r} exists in this schema".format(column))
             
-        ret_rows = list()
-        for r in self.rows:
-            if where(r):
-                ret_rows.append(r)
-                
-        return ret_rows
+        return [self._row_at(idx) for idx, v in enumerate(self._columns[column]) if predicate(v)]
         
     def update(self, set_columns: Row, where: WhereClause = None) -> int:
         """
@@ -234,24 +353,24 @@ class FlexibleSchema:
         
         returns number of rows updated.
         """
-        if where is None:
-            where = lambda r: True            
+        where = _where_func(where)
 
+        fields = self._model.fields
+        new_values = dict()
         for col in set_columns:
-            if col not in self._model:
-                raise ValueError("no field named {!r} exists in this schema. Add to model first.")
+            if col not in fields:
+                raise ValueError("no field named {!r} exists in this schema. Add to model first.".format(col))
+            v = set_columns[col]
+            new_values[col] = None if v is None else _value_converter(fields[col])(v)
             
-        updated = 0
-        for r in self.rows:
-            if where(r):
-                for col in set_columns:
-                    if col not in self._model:
-                        raise ValueError("no field named {!r} exists in this schema. Add to model first.")
-                    field = self._model[col]
-                    r[col] = field.type_conv(set_columns[col])
-                    updated += 1
+        row_updates = list(itertools.compress(range(self._n), self._scan(where)))
+        for col in new_values:
+            column = self._columns[col]
+            v = new_values[col]
+            for idx in row_updates:
+                column[idx] = v
                     
-        return updated
+        return len(row_updates)
             
     def drop(self, where: WhereClause = None) -> int:
         """
@@ -259,31 +378,91 @@ class FlexibleSchema:
         
         returns number of rows dropped.
         """
-        if where is None:
-            where = lambda r: True
+        where = _where_func(where)
+        
+        keep = list(map(operator.not_, self._scan(where)))
+        dropped = keep.count(False)
+        if dropped < 1:
+            return 0
+        
+        # rebuild each column in a single pass rather than deleting one index at
+        # a time, which would shift the rest of the list on every deletion
+        for col in self._columns:
+            self._columns[col] = list(itertools.compress(self._columns[col], keep))
+        self._n -= dropped
+            
+        return dropped
         
-        row_drops = list()
-        for idx, r in enumerate(self.rows):
-            if where(r):
-                row_drops.append(idx)
-                
-        for idx in reversed(row_drops):
-            del self.rows[idx]
+    def _row_at(self, idx: int) -> Row:
+        return {f: col[idx] for f, col in self._columns.items()}
+        
+    def _scan(self, where: Callable[[Row], bool]) -> List[bool]:
+        """
+        Get whether each row matches where, in row order.
+        """
+        return list(map(where, self._iter_rows()))
+        
+    def _iter_rows(self) -> Iterator[Row]:
+        # built entirely from map/zip so that iterating the rows does not run any
+        # bytecode per row
+        if len(self._columns) < 1:
+            return map(dict, itertools.repeat((), self._n))
             
-        return len(row_drops)
+        names = list(self._columns)
+        return map(dict, map(functools.partial(zip, names), zip(*self._columns.values())))
+
+
+def _value_converter(field: FieldDef) -> Callable[[Any], FieldValue]:
+    """
+    Get the function that converts values stored in the given field. Strings are
+    interned so that the many repeated values typical of a column share one
+    object and compare by identity.
+    """
+    if field.type is str:
+        return _intern_str
+    return field.type
+    
+    
+def _intern_str(v: Any) -> str:
+    return sys.intern(str(v))
+
+
+def _where_func(where: WhereClause) -> Callable[[Row], bool]:
+    """
+    Get the callable to test rows with for the given where clause. A where clause
+    can be given as a callable that accepts a row, or as a string that is a Python
+    expression evaluated with the columns of the row as variables, such as
+    "age > 5 and name == 'x'". If it is None, every row matches.
+    """
+    if where is None:
+        return lambda r: True
+    if isinstance(where, str):
+        return _compile_where(where)
+    return where
+    
+
+@functools.lru_cache(maxsize=256)
+def _compile_where(src: str) -> Callable[[Row], bool]:
+    code = compile(src, '<where>', 'eval')
+    where_globals = {}
+    
+    def where(r: Row) -> bool:
+        return eval(code, where_globals, r)
+        
+    return where
 
 
 class FlexibleStore:
+    __slots__ = ('schemas',)
+
     def __init__(self):
         self.schemas: Dict[str, FlexibleSchema] = {}
     
     def to_dict(self) -> Dict[str, SerializedValue]:
         d = {
             'version': SerializationVersion,
-            'schemas': list()
+            'schemas': [s.to_dict() for s in self.schemas.values()]
         }
-        for s in self:
-            d['schemas'].append(self[s].to_dict())
         
         return d
         
@@ -307,7 +486,7 @@ class FlexibleStore:
             except Exception as e:
                 raise ValueError("schemas[{:d}]: {:s}".format(idx, str(e)))
             if schema.name in fs:
-                raise ValueError("schema {!r} has duplicate entries".format(field.name))
+                raise ValueError("schema {!r} has duplicate entries".format(schema.name))
                 
             fs.schemas[schema.name] = schema
             
@@ -315,7 +494,7 @@ class FlexibleStore:
         
     def create_schema(self, schema: str, model: Optional[Model] = None):
         if schema in self:
-            raise ValueError("schema named {!r} already exists".format(name))
+            raise ValueError("schema named {!r} already exists".format(schema))
         self.schemas[schema] = FlexibleSchema(schema, model)
         
     def drop_schema(self, schema: str) -> bool:
@@ -329,31 +508,31 @@ class FlexibleStore:
             return True
         
     def alter(self, schema: str, new_model: Model):
-        if schema in self:
+        if schema not in self:
             raise ValueError("no such schema {!r}".format(schema))
             
         return self[schema].alter(new_model)
         
     def insert(self, schema: str, row: Row):
-        if schema in self:
+        if schema not in self:
             raise ValueError("no such schema {!r}".format(schema))
             
         return self[schema].insert(row)
         
     def select(self, schema: str, where: WhereClause = None) -> List[Row]:
-        if schema in self:
+        if schema not in self:
             raise ValueError("no such schema {!r}".format(schema))
             
         return self[schema].select(where)
         
     def update(self, schema: str, set_columns: Row, where: WhereClause = None) -> int:
-        if schema in self:
+        if schema not in self:
             raise ValueError("no such schema {!r}".format(schema))
             
         return self[schema].update(set_columns, where)
         
     def drop(self, schema: str, where: WhereClause = None) -> int:
-        if schema in self:
+        if schema not in self:
             raise ValueError("no such schema {!r}".format(schema))
             
         return self[schema].drop(where)
@@ -0,0 +1,34 @@
+import unittest
+
+from frogcherub import events
+
+
+class TestConstraint(unittest.TestCase):
+
+    def test_types(self):
+        self.assertIn("narrative_immediate", events.Constraint.types)
+        self.assertIn("absolute", events.Constraint.types)
+
+    def test_narrative_immediate(self):
+        sut = events.Constraint("narrative_immediate", ref_event="abc", is_after=True)
+
+        self.assertEqual(sut.type, "narrative_immediate")
+        self.assertEqual(sut.ref_event, "abc")
+
+
+class TestEvent(unittest.TestCase):
+
+    def setUp(self):
+        self.sut = events.Event(universes=[
+            {"name": "u1", "timelines": [{"path": "t1", "locations": [{"path": "l1"}, {"path": "l2"}]}]},
+        ])
+
+    def test_has_location_with_only_location(self):
+        self.assertTrue(self.sut.has_location(events.ParadoxAddress(location="l2")))
+        self.assertFalse(self.sut.has_location(events.ParadoxAddress(location="l3")))
+
+    def test_find_location_with_only_location(self):
+        idx, loc = self.sut.find_location(events.ParadoxAddress(location="l2"))
+
+        self.assertEqual(idx, 1)
+        self.assertIs(loc, self.sut.universes[0].timelines[0].locations[1])
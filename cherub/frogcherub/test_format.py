@@ -203,6 +203,33 @@ class TestFormat(unittest.TestCase):
                     "that also will be\n"
                     "wrapped."
                 )
+            ),
+            TC(
+                name="lines that already fit",
+                input=(
+                    "exactly eighteen c\n"
+                    "\n"
+                    "short"
+                ),
+                width=18,
+                expected=(
+                    "exactly eighteen c\n"
+                    "\n"
+                    "short"
+                )
+            ),
+            TC(
+                name="fitting lines with edge spaces",
+                input=(
+                    " leading\n"
+                    "trailing \n"
+                    " "
+                ),
+                width=18,
+                expected=(
+                    "leading\n"
+                    "trailing"
+                )
             )
         ]
 
@@ -321,3 +348,35 @@ class TestFormat(unittest.TestCase):
             with self.subTest(tc.name, input=tc.input, width=tc.width, extend=tc.extend):
                 with self.assertRaises(ValueError):
                     format.wrap(tc.input, tc.width, tc.extend)
+
+    def test_remove_ansi_escapes(self):
+        TC = namedtuple('TC', ['name', 'input', 'expected'])
+
+        test_cases = [
+            TC(
+                name="empty string",
+                input="",
+                expected=""
+            ),
+            TC(
+                name="no escapes",
+                input="add char",
+                expected="add char"
+            ),
+            TC(
+                name="arrow key sequences",
+                input="add\x1b[D\x1b[C char",
+                expected="add char"
+            ),
+            TC(
+                name="two-char escape",
+                input="\x1bMshow",
+                expected="show"
+            )
+        ]
+
+        for tc in test_cases:
+            with self.subTest(tc.name, input=tc.input):
+                actual = format.remove_ansi_escapes(tc.input)
+
+                self.assertEqual(actual, tc.expected)
@@ -1,31 +1,105 @@
+import builtins
+import functools
 import unittest
-from unittest.mock import patch
+from collections import namedtuple
 
 from frogcherub import forms, util
 
-# It Would Be Nice If This Did Not Print During Every Test.
-# So We Will Turn Them Off Here
-@patch('builtins.print', lambda *args: None)
+
+class _InputPatch:
+    """
+    Replaces builtins.input with a function that returns each of the given
+    responses in order. Assigning the attribute directly is much cheaper than
+    going through unittest.mock.patch.
+    """
+    
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self._old_input = None
+        
+    def __enter__(self) -> '_InputPatch':
+        self._old_input = builtins.input
+        builtins.input = lambda *args: next(self._responses)
+        return self
+        
+    def __exit__(self, *args):
+        builtins.input = self._old_input
+
+
 class TestFormUsage(unittest.TestCase):
 
+    @classmethod
+    def setUpClass(cls):
+        # It Would Be Nice If This Did Not Print During Every Test.
+        # So We Will Turn Them Off Here
+        cls._old_print = builtins.print
+        builtins.print = lambda *args: None
+        
+    @classmethod
+    def tearDownClass(cls):
+        builtins.print = cls._old_print
+
     def setUp(self):
         self.sut = forms.Form()
 
-    @patch('builtins.input', lambda *args: 'a value')
-    def test_fill_string(self):
-        expected = {'test': "a value"}
-        self.sut.add_field("test")
+    def test_fill(self):
+        TC = namedtuple('TC', ['name', 'field_args', 'inputs', 'expected'])
 
-        actual = self.sut.fill()
+        test_cases = [
+            TC(
+                name="string",
+                field_args={},
+                inputs=["a value"],
+                expected={'test': "a value"}
+            ),
+            TC(
+                name="int",
+                field_args={'type': int},
+                inputs=["12"],
+                expected={'test': 12}
+            ),
+            TC(
+                name="invalid value is asked again",
+                field_args={'type': int},
+                inputs=["twelve", "12"],
+                expected={'test': 12}
+            ),
+            TC(
+                name="blank uses default",
+                field_args={'default': "a default"},
+                inputs=[""],
+                expected={'test': "a default"}
+            ),
+            TC(
+                name="blank nullable",
+                field_args={'nullable': True},
+                inputs=[""],
+                expected={'test': None}
+            ),
+            TC(
+                name="multivalue",
+                field_args={'multivalue': True},
+                inputs=["value one", "value two", "done"],
+                expected={'test': ["value one", "value two"]}
+            )
+        ]
 
-        self.assertEqual(actual, expected)
+        for tc in test_cases:
+            with self.subTest(tc.name, inputs=tc.inputs):
+                sut = forms.Form()
+                sut.add_field("test", **tc.field_args)
+
+                with _InputPatch(tc.inputs):
+                    actual = sut.fill()
+
+                self.assertEqual(actual, tc.expected)
 
-    @patch('builtins.input', side_effect=["value one", ""])
-    def test_default_last(self, _):
+    def test_default_last(self):
         self.sut.add_field("test", default_last=True)
 
-        actual_1 = self.sut.fill()
-        actual_2 = self.sut.fill()
+        with _InputPatch(["value one", ""]):
+            actual_1 = self.sut.fill()
+            actual_2 = self.sut.fill()
 
         # both should be the same because second should default to last entered
         expected = [
@@ -36,27 +110,39 @@ class TestFormUsage(unittest.TestCase):
 
         self.assertEqual(actual, expected)
         
-    @patch('builtins.input', side_effect=["", "", ""])
-    def test_callable_default(self, _):
-        give_default = util.SequenceProvider("one", "two", "three")
-    
-        self.sut.add_field("test", default=give_default)
-        
-        actual_1 = self.sut.fill()
-        actual_2 = self.sut.fill()
-        actual_3 = self.sut.fill()
-        
-        expected = [
-            {'test': 'one'},
-            {'test': 'two'},
-            {'test': 'three'}
+    def test_callable_default(self):
+        def give_default_gen():
+            yield "one"
+            yield "two"
+            yield "three"
+            
+        default_gen = (v for v in ["one", "two", "three"])
+        providers = [
+            ("SequenceProvider", util.SequenceProvider("one", "two", "three")),
+            ("generator", functools.partial(next, default_gen)),
+            ("generator function", give_default_gen),
         ]
-        actual = [actual_1, actual_2, actual_3]
         
-        self.assertEqual(actual, expected)
+        for name, give_default in providers:
+            with self.subTest(name):
+                sut = forms.Form()
+                sut.add_field("test", default=give_default)
+                
+                with _InputPatch(["", "", ""]):
+                    actual_1 = sut.fill()
+                    actual_2 = sut.fill()
+                    actual_3 = sut.fill()
+                
+                expected = [
+                    {'test': 'one'},
+                    {'test': 'two'},
+                    {'test': 'three'}
+                ]
+                actual = [actual_1, actual_2, actual_3]
+                
+                self.assertEqual(actual, expected)
     
-    @patch('builtins.input', side_effect=["answer"])
-    def test_entry_hook_normal_field(self, _):
+    def test_entry_hook_normal_field(self):
         received = None
         def hook(v):
             nonlocal received
@@ -64,7 +150,8 @@ class TestFormUsage(unittest.TestCase):
         
         self.sut.add_field("test", entry_hook=hook)
         
-        self.sut.fill()
+        with _InputPatch(["answer"]):
+            self.sut.fill()
         
         actual = received
         expected = "answer"
@@ -83,8 +170,7 @@ class TestFormUsage(unittest.TestCase):
         
         self.assertIsNotNone(received)
     
-    @patch('builtins.input', side_effect=["answer1", "answer2"])
-    def test_done_hook(self, _):
+    def test_done_hook(self):
         called = True
         def hook(*args):
             nonlocal called
@@ -94,12 +180,12 @@ class TestFormUsage(unittest.TestCase):
         subform.add_field("test1")
         subform.add_field("test2")
         
-        self.sut.fill()
+        with _InputPatch(["answer1", "answer2"]):
+            self.sut.fill()
         
         self.assertTrue(called)
     
-    @patch('builtins.input', side_effect=["yes", "answer1", "answer2", "yes", "answer3", "answer4", "no"])
-    def test_done_hook_multivalue(self, _):
+    def test_done_hook_multivalue(self):
         call_count = 0
         def hook(*args):
             nonlocal call_count
@@ -109,14 +195,14 @@ class TestFormUsage(unittest.TestCase):
         subform.add_field("test1")
         subform.add_field("test2")
         
-        self.sut.fill()
+        with _InputPatch(["yes", "answer1", "answer2", "yes", "answer3", "answer4", "no"]):
+            self.sut.fill()
         
         expected = 2
         actual = call_count
         self.assertEqual(actual, expected)
     
-    @patch('builtins.input', side_effect=["yes", "answer1", "answer2"])
-    def test_done_hook_nullable_nonnull(self, _):
+    def test_done_hook_nullable_nonnull(self):
         call_count = 0
         def hook(*args):
             nonlocal call_count
@@ -126,14 +212,14 @@ class TestFormUsage(unittest.TestCase):
         subform.add_field("test1")
         subform.add_field("test2")
         
-        self.sut.fill()
+        with _InputPatch(["yes", "answer1", "answer2"]):
+            self.sut.fill()
         
         expected = 1
         actual = call_count
         self.assertEqual(actual, expected)
     
-    @patch('builtins.input', side_effect=["no"])
-    def test_done_hook_nullable_null(self, _):
+    def test_done_hook_nullable_null(self):
         call_count = 0
         def hook(*args):
             nonlocal call_count
@@ -143,14 +229,14 @@ class TestFormUsage(unittest.TestCase):
         subform.add_field("test1")
         subform.add_field("test2")
         
-        self.sut.fill()
+        with _InputPatch(["no"]):
+            self.sut.fill()
         
         expected = 1
         actual = call_count
         self.assertEqual(actual, expected)
     
-    @patch('builtins.input', side_effect=["yes", "yes", "answer1", "answer2", "yes", "no", "no"])
-    def test_done_hook_multivalue_nullable(self, _):
+    def test_done_hook_multivalue_nullable(self):
         call_count = 0
         def hook(*args):
             nonlocal call_count
@@ -160,7 +246,8 @@ class TestFormUsage(unittest.TestCase):
         subform.add_field("test1")
         subform.add_field("test2")
         
-        result = self.sut.fill()
+        with _InputPatch(["yes", "yes", "answer1", "answer2", "yes", "no", "no"]):
+            result = self.sut.fill()
         
         expected = 2
         actual = call_count
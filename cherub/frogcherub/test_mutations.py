@@ -1,105 +1,102 @@
+import copy
 import unittest
-from unittest.mock import patch
 
 from frogcherub import mutations
 
-class TestMutations(unittest.TestCase):
-
-    def test_universe_collapse(self):
-        data = {
-            "events": [
+# shared between tests; universe_collapse modifies its input, so tests must work
+# on a deepcopy of _UNIVERSE_COLLAPSE_INPUT.
+_UNIVERSE_COLLAPSE_INPUT = {
+    "events": [
+        {
+            "unrelated": "one",
+            "universes": [
                 {
-                    "unrelated": "one",
-                    "universes": [
-                        {
-                            "characters": [
-                                "john-egbert"
-                            ],
-                            "items": [],
-                            "location": "/earth/egberthouse/johnsroom",
-                            "name": "earth-pre-scratch",
-                            "timeline": "/"
-                        }
-                    ]
+                    "characters": [
+                        "john-egbert"
+                    ],
+                    "items": [],
+                    "location": "/earth/egberthouse/johnsroom",
+                    "name": "earth-pre-scratch",
+                    "timeline": "/"
+                }
+            ]
+        },
+        {
+            "unrelated": "two",
+            "universes": [
+                {
+                    "characters": [
+                        "john-egbert"
+                    ],
+                    "items": [
+                        "fake-arms"
+                    ],
+                    "location": "/earth/egberthouse/johnsroom",
+                    "name": "earth-pre-scratch",
+                    "timeline": "/"
                 },
                 {
-                    "unrelated": "two",
-                    "universes": [
-                        {
-                            "characters": [
-                                "john-egbert"
-                            ],
-                            "items": [
-                                "fake-arms"
-                            ],
-                            "location": "/earth/egberthouse/johnsroom",
-                            "name": "earth-pre-scratch",
-                            "timeline": "/"
-                        },
-                        {
-                            "characters": [
-                                "dave-strider"
-                            ],
-                            "items": [],
-                            "location": "/earth/striderhouse/davesroom",
-                            "name": "earth-pre-scratch",
-                            "timeline": "/"
-                        }
-                    ]
+                    "characters": [
+                        "dave-strider"
+                    ],
+                    "items": [],
+                    "location": "/earth/striderhouse/davesroom",
+                    "name": "earth-pre-scratch",
+                    "timeline": "/"
                 }
             ]
         }
-        
-        expected = {
-            "events": [
+    ]
+}
+
+_UNIVERSE_COLLAPSE_EXPECTED = {
+    "events": [
+        {
+            "unrelated": "one",
+            "universes": [
                 {
-                    "unrelated": "one",
-                    "universes": [
+                    "name": "earth-pre-scratch",
+                    "timelines": [
                         {
-                            "name": "earth-pre-scratch",
-                            "timelines": [
+                            "path": "/",
+                            "locations": [
                                 {
-                                    "path": "/",
-                                    "locations": [
-                                        {
-                                            "path": "/earth/egberthouse/johnsroom",
-                                            "characters": [
-                                                "john-egbert"
-                                            ],
-                                            "items": []
-                                        }
-                                    ]
+                                    "path": "/earth/egberthouse/johnsroom",
+                                    "characters": [
+                                        "john-egbert"
+                                    ],
+                                    "items": []
                                 }
                             ]
                         }
                     ]
-                },
+                }
+            ]
+        },
+        {
+            "unrelated": "two",
+            "universes": [
                 {
-                    "unrelated": "two",
-                    "universes": [
+                    "name": "earth-pre-scratch",
+                    "timelines": [
                         {
-                            "name": "earth-pre-scratch",
-                            "timelines": [
+                            "path": "/",
+                            "locations": [
                                 {
-                                    "path": "/",
-                                    "locations": [
-                                        {
-                                            "path": "/earth/egberthouse/johnsroom",
-                                            "characters": [
-                                                "john-egbert"
-                                            ],
-                                            "items": [
-                                                "fake-arms"
-                                            ]
-                                        },
-                                        {
-                                            "path": "/earth/striderhouse/davesroom",
-                                            "characters": [
-                                                "dave-strider"
-                                            ],
-                                            "items": []
-                                        }
+                                    "path": "/earth/egberthouse/johnsroom",
+                                    "characters": [
+                                        "john-egbert"
+                                    ],
+                                    "items": [
+                                        "fake-arms"
                                     ]
+                                },
+                                {
+                                    "path": "/earth/striderhouse/davesroom",
+                                    "characters": [
+                                        "dave-strider"
+                                    ],
+                                    "items": []
                                 }
                             ]
                         }
@@ -107,9 +104,16 @@ class TestMutations(unittest.TestCase):
                 }
             ]
         }
+    ]
+}
+
+
+class TestMutations(unittest.TestCase):
+
+    def test_universe_collapse(self):
+        data = copy.deepcopy(_UNIVERSE_COLLAPSE_INPUT)
 
         rows_changed = mutations.universe_collapse(data)
 
         self.assertEqual(rows_changed, 2)
-        self.assertEqual(data, expected)
-
+        self.assertEqual(data, _UNIVERSE_COLLAPSE_EXPECTED)
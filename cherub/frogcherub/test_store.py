@@ -0,0 +1,191 @@
+import pickle
+import unittest
+
+from frogcherub import store
+
+
+class TestModel(unittest.TestCase):
+
+    def test_container_protocol(self):
+        sut = store.Model()
+        sut.add_field("name")
+        sut.add_field("age", "int", 0)
+
+        self.assertEqual(len(sut), 2)
+        self.assertEqual(list(sut), ["name", "age"])
+        self.assertIn("age", sut)
+        self.assertNotIn("height", sut)
+        self.assertIs(sut["age"].type, int)
+
+    def test_add_field_invalid_name(self):
+        sut = store.Model()
+
+        for name in ["-", "first-name", "$cost", "1st", "", "naïve", "class", "None"]:
+            self.assertRaises(ValueError, sut.add_field, name)
+        self.assertEqual(len(sut), 0)
+
+    def test_from_dict_duplicate_field(self):
+        d = {
+            "fields": [
+                {"name": "name", "type": "str", "default": None},
+                {"name": "name", "type": "int", "default": None},
+            ]
+        }
+
+        self.assertRaises(ValueError, store.Model.from_dict, d)
+
+    def test_copy_is_independent(self):
+        sut = store.Model()
+        sut.add_field("name")
+
+        copied = sut.copy()
+        copied.add_field("age", "int")
+
+        self.assertNotIn("age", sut)
+
+    def test_pickle_round_trip(self):
+        sut = store.Model()
+        sut.add_field("name")
+        sut.add_field("age", "int", 3)
+
+        actual = pickle.loads(pickle.dumps(sut))
+
+        self.assertEqual(list(actual), ["name", "age"])
+        self.assertIs(actual["age"], sut["age"])
+        self.assertEqual(actual["age"].default, 3)
+
+    def test_shared_fields_keep_their_own_defaults(self):
+        first = store.Model()
+        first.add_field("x", "str", 1)
+        first.add_field("y", "str", 1.0)
+        sut = store.Model()
+        sut.add_field("x", "str", True)
+        sut.add_field("y", "str", 1)
+
+        self.assertEqual(sut["x"].default, "True")
+        self.assertEqual(sut["y"].default, "1")
+
+    def test_unhashable_default(self):
+        sut = store.Model()
+        sut.add_field("x", "str", [1])
+
+        self.assertEqual(sut["x"].default, "[1]")
+
+    def test_field_is_immutable(self):
+        sut = store.Model()
+        sut.add_field("x", "int", 1)
+
+        with self.assertRaises(AttributeError):
+            sut["x"].default = 2
+        self.assertEqual(sut["x"].default, 1)
+
+
+class TestFlexibleSchema(unittest.TestCase):
+
+    def setUp(self):
+        model = store.Model()
+        model.add_field("name")
+        model.add_field("age", "int", 0)
+        self.sut = store.FlexibleSchema("people", model)
+        self.sut.insert_many([
+            {"name": "john", "age": "13"},
+            {"name": "dave", "age": 13},
+            {"name": "rose"},
+        ])
+
+    def test_insert_applies_defaults_and_types(self):
+        expected = [
+            {"name": "john", "age": 13},
+            {"name": "dave", "age": 13},
+            {"name": "rose", "age": 0},
+        ]
+
+        self.assertEqual(self.sut.rows, expected)
+        self.assertEqual(len(self.sut), 3)
+
+    def test_insert_many_unknown_field_inserts_nothing(self):
+        rows = [{"name": "jade"}, {"name": "jake", "height": 6}]
+
+        self.assertRaises(ValueError, self.sut.insert_many, rows)
+        self.assertEqual(len(self.sut), 3)
+
+    def test_invalid_name(self):
+        self.assertRaises(ValueError, store.FlexibleSchema, "the-people")
+
+    def test_later_model_changes_are_ignored(self):
+        model = store.Model()
+        model.add_field("a", "int")
+        sut = store.FlexibleSchema("things", model)
+        model.add_field("b")
+
+        self.assertRaises(ValueError, sut.insert, {"a": 1, "b": "z"})
+        self.assertEqual(len(sut), 0)
+        self.assertEqual(list(sut.model), ["a"])
+
+    def test_select_callable(self):
+        actual = self.sut.select(lambda r: r["age"] > 10)
+
+        self.assertEqual([r["name"] for r in actual], ["john", "dave"])
+
+    def test_select_string(self):
+        actual = self.sut.select("age == 0 or name == 'john'")
+
+        self.assertEqual([r["name"] for r in actual], ["john", "rose"])
+
+    def test_select_by(self):
+        actual = self.sut.select_by("name", lambda v: v.startswith("d"))
+
+        self.assertEqual(actual, [{"name": "dave", "age": 13}])
+
+    def test_update(self):
+        updated = self.sut.update({"age": "14"}, "age == 13")
+
+        self.assertEqual(updated, 2)
+        self.assertEqual([r["age"] for r in self.sut.rows], [14, 14, 0])
+
+    def test_drop(self):
+        dropped = self.sut.drop("name != 'rose'")
+
+        self.assertEqual(dropped, 2)
+        self.assertEqual(self.sut.rows, [{"name": "rose", "age": 0}])
+
+    def test_alter(self):
+        new_model = self.sut.model
+        del new_model.fields["name"]
+        new_model.fields["age"] = store.FieldDef("age", "str")
+        new_model.add_field("alive", "bool", True)
+
+        self.sut.alter(new_model)
+
+        expected = [
+            {"age": "13", "alive": True},
+            {"age": "13", "alive": True},
+            {"age": "0", "alive": True},
+        ]
+        self.assertEqual(self.sut.rows, expected)
+
+    def test_dict_round_trip(self):
+        actual = store.FlexibleSchema.from_dict(self.sut.to_dict())
+
+        self.assertEqual(actual.name, self.sut.name)
+        self.assertEqual(actual.rows, self.sut.rows)
+
+
+class TestFlexibleStore(unittest.TestCase):
+
+    def test_missing_schema(self):
+        sut = store.FlexibleStore()
+
+        self.assertRaises(ValueError, sut.insert, "people", {"name": "john"})
+
+    def test_dict_round_trip(self):
+        sut = store.FlexibleStore()
+        model = store.Model()
+        model.add_field("name")
+        sut.create_schema("people", model)
+        sut.insert("people", {"name": "john"})
+
+        actual = store.FlexibleStore.from_dict(sut.to_dict())
+
+        self.assertEqual(list(actual), ["people"])
+        self.assertEqual(actual.select("people"), [{"name": "john"}])
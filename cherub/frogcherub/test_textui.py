@@ -0,0 +1,94 @@
+import unittest
+from unittest import mock
+
+from frogcherub import textui
+
+
+class TestAppRemove(unittest.TestCase):
+
+    def setUp(self):
+        self.sut = textui.App()
+        w = self.sut.w
+        w.add_scene(location="l1", timeline="t1", universe="u1")
+        w.add_scene(location="l2")
+        w.add_scene(timeline="t2")
+        w.add_scene(universe="u2")
+
+    def remove(self, *answers) -> bool:
+        with mock.patch.object(textui, "input_str", side_effect=answers), \
+                mock.patch.object(textui.entry, "confirm", return_value=True):
+            return self.sut._remove()
+
+    def test_remove_location(self):
+        actual = self.remove("location", "l2")
+
+        self.assertTrue(actual)
+        univs = self.sut.w.current_event.universes
+        self.assertEqual([loc.path for loc in univs[0].timelines[0].locations], ["l1"])
+        self.assertEqual([tl.path for tl in univs[0].timelines], ["t1", "t2"])
+        self.assertEqual([u.name for u in univs], ["u1", "u2"])
+
+    def test_remove_timeline(self):
+        actual = self.remove("timeline", "t2")
+
+        self.assertTrue(actual)
+        univs = self.sut.w.current_event.universes
+        self.assertEqual([tl.path for tl in univs[0].timelines], ["t1"])
+        self.assertEqual([loc.path for loc in univs[0].timelines[0].locations], ["l1", "l2"])
+        self.assertEqual([u.name for u in univs], ["u1", "u2"])
+
+    def test_remove_universe(self):
+        actual = self.remove("universe", "u2")
+
+        self.assertTrue(actual)
+        univs = self.sut.w.current_event.universes
+        self.assertEqual([u.name for u in univs], ["u1"])
+        self.assertEqual([tl.path for tl in univs[0].timelines], ["t1", "t2"])
+
+
+class TestAppAdd(unittest.TestCase):
+
+    def setUp(self):
+        self.sut = textui.App()
+        self.sut.w.add_scene(location="l1", timeline="t1", universe="u1")
+
+    def add(self, target: str, *answers):
+        with mock.patch.object(textui, "input_str", side_effect=answers), \
+                mock.patch("builtins.print") as mock_print:
+            return self.sut._perform_add(target), mock_print
+
+    def test_add_duplicate_timeline(self):
+        actual, mock_print = self.add("timeline", "t1")
+
+        self.assertEqual(actual, (False, None))
+        mock_print.assert_called_once_with("That timeline already exists")
+        timelines = self.sut.w.current_event.universes[0].timelines
+        self.assertEqual([tl.path for tl in timelines], ["t1"])
+
+    def test_add_distinct_timeline(self):
+        actual, mock_print = self.add("timeline", "t2")
+
+        self.assertEqual(actual, (True, "t2"))
+        self.assertNotIn(mock.call("That timeline already exists"), mock_print.call_args_list)
+        timelines = self.sut.w.current_event.universes[0].timelines
+        self.assertEqual([tl.path for tl in timelines], ["t1", "t2"])
+
+
+class TestAppDisplay(unittest.TestCase):
+
+    def setUp(self):
+        self.sut = textui.App()
+
+    def test_following_without_location(self):
+        actual = self.sut._build_following_component_text(self.sut._take_snapshot())
+
+        self.assertEqual(actual, "Following:\n(Nobody)\n\nIn:\nU: (!) None\nT: (!) None\nL: (!) None")
+
+    def test_following_with_location(self):
+        self.sut.w.add_scene(location="l1", timeline="t1", universe="u1")
+        self.sut.w.add_char("john")
+        self.sut.w.following = "john"
+
+        actual = self.sut._build_following_component_text(self.sut._take_snapshot())
+
+        self.assertEqual(actual, "Following:\njohn\n\nIn:\nU:u1\nT:t1\nL:l1\n")
@@ -0,0 +1,37 @@
+import unittest
+
+from frogcherub import util
+
+
+class TestSequenceProvider(unittest.TestCase):
+
+    def test_repeats(self):
+        sut = util.SequenceProvider("a", "b")
+
+        actual = [sut() for _ in range(5)]
+
+        self.assertEqual(actual, ["a", "b", "a", "b", "a"])
+
+    def test_empty(self):
+        sut = util.SequenceProvider()
+
+        self.assertIsNone(sut())
+
+    def test_appended_members_are_used(self):
+        sut = util.SequenceProvider("a", "b", "c")
+        for _ in range(4):
+            sut()
+
+        sut.members.append("d")
+        actual = [sut() for _ in range(5)]
+
+        self.assertEqual(actual, ["b", "c", "d", "a", "b"])
+
+    def test_turning_off_repeat_keeps_position(self):
+        sut = util.SequenceProvider("a", "b", "c")
+        sut()
+
+        sut.repeat = False
+        actual = [sut() for _ in range(3)]
+
+        self.assertEqual(actual, ["b", "c", None])
@@ -0,0 +1,145 @@
+import unittest
+from unittest import mock
+
+from frogcherub.events import Event, ParadoxAddress
+from frogcherub.wizahd import Wizahd
+
+
+def _new_wizahd() -> Wizahd:
+    """Get a Wizahd following john in a single room."""
+    w = Wizahd([])
+    w.add_scene(location="room", timeline="alpha", universe="beta")
+    w.add_char("john")
+    w.following = "john"
+    return w
+
+
+class TestWizahd(unittest.TestCase):
+
+    def test_item_methods_follow_char_to_new_location(self):
+        sut = _new_wizahd()
+        sut.remove_char("john")
+        sut.add_scene(location="lab")
+        lab = sut.current_event.universes[0].timelines[0].locations[1]
+        lab.characters.add("john")
+        lab.items.add("hammer")
+        sut.add_item("nail")
+
+        sut.obtain_item("hammer")
+        sut.add_char("john")
+        sut.obtain_item("nail")
+
+        self.assertEqual(sut.current_event.address_of("john").location_index, 0)
+        self.assertEqual(sut.items, ())
+        self.assertEqual(sut.current_event.universes[0].timelines[0].locations[0].items, set())
+
+    def test_advance_narrative_keeps_universe(self):
+        sut = _new_wizahd()
+
+        event = sut.advance_narrative(1)
+
+        self.assertEqual(event.universes[0].name, "beta")
+        self.assertEqual(sut.universe, "beta")
+        self.assertIs(sut.get_last_event(ParadoxAddress(universe="beta", timeline="alpha", location="room")), event)
+
+    def test_carry_over_scene(self):
+        sut = _new_wizahd()
+        sut.add_item("hammer")
+        sut.advance_narrative(1)
+        sut.drop_item("nail")
+        sut.goto(0)
+
+        carried = sut.carry_over_scene(ParadoxAddress(universe="beta", timeline="alpha", location="room"))
+
+        self.assertTrue(carried)
+        self.assertEqual(set(sut.items), {"hammer", "nail"})
+        self.assertEqual(set(sut.characters), {"john"})
+        loc = sut.current_event.universes[0].timelines[0].locations[0]
+        self.assertEqual(loc.items, {"hammer", "nail"})
+        self.assertEqual(loc.characters, {"john"})
+
+    def test_add_items_and_chars(self):
+        sut = _new_wizahd()
+
+        sut.add_items(["hammer", "nail", "hammer"])
+        sut.add_chars(["rose", "john"])
+
+        loc = sut.current_event.universes[0].timelines[0].locations[0]
+        self.assertEqual(set(sut.items), {"hammer", "nail"})
+        self.assertEqual(loc.items, {"hammer", "nail"})
+        self.assertEqual(set(sut.characters), {"john", "rose"})
+        self.assertEqual(loc.characters, {"john", "rose"})
+        self.assertEqual(sut.current_event.address_of("rose").location, "room")
+
+        sut.give_item("hammer", "rose")
+        sut.obtain_item("nail", char="rose")
+
+        self.assertEqual(sut.items, ())
+        self.assertEqual(loc.items, set())
+
+    def test_remove_items_and_chars(self):
+        sut = _new_wizahd()
+        sut.add_items(["hammer", "nail"])
+        sut.add_char("rose")
+
+        sut.remove_items(["nail", "not-here"])
+        sut.remove_chars(["rose", "not-here"])
+
+        loc = sut.current_event.universes[0].timelines[0].locations[0]
+        self.assertEqual(sut.items, ("hammer",))
+        self.assertEqual(loc.items, {"hammer"})
+        self.assertEqual(sut.characters, ("john",))
+        self.assertEqual(loc.characters, {"john"})
+        self.assertIsNone(sut.current_event.address_of("rose"))
+        self.assertIsNone(sut.current_event.address_of("nail"))
+        self.assertRaises(ValueError, sut.obtain_item, "hammer", "rose")
+        self.assertRaises(ValueError, sut.obtain_item, "nail")
+
+        sut.obtain_item("hammer")
+
+        self.assertEqual(sut.items, ())
+
+    def test_single_add_and_remove(self):
+        sut = _new_wizahd()
+
+        sut.add_item("hammer")
+        sut.add_item("hammer")
+        sut.remove_item("nail")
+        sut.remove_char("rose")
+
+        self.assertEqual(sut.items, ("hammer",))
+        self.assertEqual(sut.characters, ("john",))
+
+    def test_add_without_location(self):
+        sut = Wizahd([])
+
+        self.assertRaises(ValueError, sut.add_items, ["hammer"])
+        self.assertRaises(ValueError, sut.add_chars, ["john"])
+
+    def test_preserving_scene_change(self):
+        sut = _new_wizahd()
+        sut.add_item("hammer")
+        sut.add_scene(location="lab")
+        sut.advance_narrative(1)
+
+        sut.scene_change("lab", preserve=True)
+
+        locs = sut.current_event.universes[0].timelines[0].locations
+        self.assertEqual([loc.path for loc in locs], ["lab", "room"])
+        self.assertEqual(locs[1].items, {"hammer"})
+        self.assertEqual(sut.location, "lab")
+        self.assertEqual(sut.items, ())
+
+    def test_preserving_scene_change_failure_leaves_event_unchanged(self):
+        sut = _new_wizahd()
+        sut.add_item("hammer")
+        sut.add_scene(location="lab")
+        sut.advance_narrative(1)
+        before = [u.to_dict() for u in sut.current_event.universes]
+
+        with mock.patch.object(Event, "scene_at_end", side_effect=ValueError("no scene")):
+            self.assertRaises(ValueError, sut.scene_change, "lab", preserve=True)
+
+        self.assertEqual([u.to_dict() for u in sut.current_event.universes], before)
+        self.assertEqual(sut.location, "room")
+        self.assertEqual(sut.items, ("hammer",))
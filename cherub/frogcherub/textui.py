@@ -1,8 +1,11 @@
 # Contains classes for working with the wizahd from the command line
 
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Tuple, NamedTuple, Callable
+import functools
+import sys
+
 from . import wizahd, entry
-from .events import Event, ParadoxAddress
+from .events import Event, ParadoxAddress, Tag, Citation
 from . import format
 
 TotalWidth = 80
@@ -25,23 +28,164 @@ _following_width = int(round(_usable_upper_left_width * _left_percent_within_lef
 _name_and_desc_width = _usable_upper_left_width - _following_width
 
 
-def input_str(prompt: str) -> str:
-    if prompt.endswith(":"):
-        prompt += " "
-    elif not prompt.endswith(": "):
-        prompt += ": "
 
-    user_input = entry.get(str, prompt, allow_blank=True)
+class _Layout(NamedTuple):
+    """Widths of each part of the display."""
+    total: int
+    left: int
+    right: int
+    following: int
+    name_and_desc: int
+
+
+_layout = _Layout(TotalWidth, _left_width, _right_width, _following_width, _name_and_desc_width)
+
+# separator bars never change size, so build them once
+_total_bar = '-' * _layout.total
+_left_bar = '-' * _layout.left
+_name_and_desc_bar = '-' * _layout.name_and_desc
+
+_help_row = "* {:s} - {:s}".format
+
+_targets = frozenset(('universe', 'timeline', 'location', 'item', 'char'))
+_target_err = "Must be one of 'universe', 'timeline', 'location', 'item', or 'char'"
+_utl_letters = frozenset('utl')
+
+# column layouts are likewise fixed, so bind their widths once
+_main_columns = functools.partial(
+    format.columns,
+    left_width=_layout.left + 1,
+    right_width=_layout.right + 1,
+    no_lwrap=True
+)
+_upper_left_columns = functools.partial(
+    format.columns,
+    left_width=_layout.following + 1,
+    right_width=_layout.name_and_desc + 1
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _wrap(s: str, width: int, extend: bool = False) -> str:
+    """
+    Cached format.wrap. Most of the display is the same from one redraw to the
+    next, so most calls can skip re-wrapping.
+    """
+    return format.wrap(s, width, extend=extend)
+
+
+class _AddSpec(NamedTuple):
+    """How to add one kind of target to the current event."""
+    # target that must be followed before this one can be added; also the name of
+    # the wizahd attribute that holds it
+    parent: Optional[str]
+    exists: Optional[Callable[[Event, str], bool]]
+    add: Callable[[wizahd.Wizahd, str], None]
+
+
+_add_specs = {
+    'universe': _AddSpec(
+        parent=None,
+        exists=lambda ev, name: ev.has_universe(ParadoxAddress(universe=name)),
+        add=lambda w, name: w.add_scene(universe=name)
+    ),
+    'timeline': _AddSpec(
+        parent='universe',
+        exists=lambda ev, name: ev.has_timeline(ParadoxAddress(timeline=name)),
+        add=lambda w, name: w.add_scene(timeline=name)
+    ),
+    'location': _AddSpec(
+        parent='timeline',
+        exists=lambda ev, name: ev.has_location(ParadoxAddress(location=name)),
+        add=lambda w, name: w.add_scene(location=name)
+    ),
+    'item': _AddSpec(parent='location', exists=None, add=lambda w, name: w.add_item(name)),
+    'char': _AddSpec(parent='location', exists=None, add=lambda w, name: w.add_char(name)),
+}
+
+
+def _format_dialog(portrayal: Citation) -> str:
+    parts = ["#{:d}".format(portrayal.panel)]
+    if portrayal.line != 0:
+        parts.append(" (DIA Line {:d}".format(portrayal.line))
+        if portrayal.character != "":
+            parts.append(" by {:s}".format(portrayal.character))
+        parts.append(")")
+    elif portrayal.character != "":
+        parts.append(" (DIA by {:s})".format(portrayal.character))
+    return ''.join(parts)
+
+
+def _format_narration(portrayal: Citation) -> str:
+    parts = ["#{:d}".format(portrayal.panel)]
+    if portrayal.paragraph != 0:
+        parts.append(" (NAR para {:d}".format(portrayal.paragraph))
+        if portrayal.sentence != 0:
+            parts.append(", sentence {:d}".format(portrayal.sentence))
+        parts.append(")")
+    elif portrayal.sentence != 0:
+        parts.append(" (NAR sentence {:d})".format(portrayal.sentence))
+    return ''.join(parts)
+
+
+def _format_media(portrayal: Citation) -> str:
+    if portrayal.timestamp != "":
+        return "#{:d} (MEDIA @{:s})".format(portrayal.panel, portrayal.timestamp)
+    return "#{:d} (MEDIA)".format(portrayal.panel)
+
+
+def _format_commentary(portrayal: Citation) -> str:
+    return "(COMMENTARY v{:s}p{:s})".format(portrayal.volume, portrayal.page)
+
+
+# how the part of the portrayal text after "Panel " is built for each citation type
+_portrayal_formats = {
+    'dialog': _format_dialog,
+    'narration': _format_narration,
+    'media': _format_media,
+    'commentary': _format_commentary,
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _normalize_prompt(prompt: str) -> str:
+    """Make the prompt end in ': '. There are only a handful of prompts, so this is cached."""
+    tail = prompt[-2:]
+    if tail != ": ":
+        prompt += " " if tail[-1:] == ":" else ": "
+    return prompt
+
+
+def input_str(prompt: str) -> str:
+    user_input = entry.get(str, _normalize_prompt(prompt), allow_blank=True)
     return user_input.strip()
 
 
+class _Snapshot(NamedTuple):
+    """The wizahd state shown in the display, as of one redraw."""
+    work: str
+    portrayal: Citation
+    following: Optional[str]
+    universe: Optional[str]
+    timeline: Optional[str]
+    location: Optional[str]
+    name: str
+    description: str
+    tags: List[Tag]
+    items: Tuple[str, ...]
+    characters: Tuple[str, ...]
+    addresses: List[ParadoxAddress]
+
+
 class App:
     def __init__(self):
         self.w = wizahd.Wizahd([])
         self.running = False
+        self._render_cache: Optional[Tuple[Tuple, str]] = None
         
     def import_events(self, events: List[Event]):
         self.w = wizahd.Wizahd(events)
+        self._render_cache = None
     
     def export_events(self) -> List[Event]:
         return self.w.copy_events()
@@ -51,9 +195,15 @@ class App:
         self.running = True
         self.w.updated = False
         updated = True
+        last_fingerprint = None
         while self.running:
             if updated:
-                self.display()
+                # commands can report an update without changing anyfin that is
+                # shown, so only redraw if the display would actually be different
+                fingerprint, main_comp = self._render()
+                if fingerprint != last_fingerprint:
+                    self._write_display(main_comp)
+                    last_fingerprint = fingerprint
                 updated = False
             command = self.input_command()
             if command is None:
@@ -68,67 +218,98 @@ class App:
         Execute the given command. Return whether the wizahd has been updated
         as a result.
         """
-        options = {
-            'exit': "Exit the Wizahd",
-            'help': "Show this help",
-            'show': "Re-print the current event display",
-            'name': "Re-name the current event",
-            'desc': "Give new description for current event",
-            'add': "Manually add universes and their items to the event",
-            'remove': "Manually remove universes and their contents from the event",
-            'swap': "Switch to a different UTL. The followed char does not come with",
-            'home': "Return to the UTL that the followed character is in",
-            'follow': "Set the current narrative main character",
-            'portrayal': "Set the panel or commentary that event is portrayed in",
-            "debug-wizahd": "Get a full print-out of the wizahd"
-        }
-        
-        if command not in options:
+        cmd = App._COMMANDS.get(command)
+        if cmd is None:
             print("Not a valid command: {!r}".format(command))
             print("Enter 'help' for help")
             return False
-            
-        if command == 'exit':
-            self.running = False
-            return False
-        elif command == 'help':
-            self._show_help(options)
-            return False
-        elif command == 'show':
-            return True
-        elif command == 'name':
-            return self._change_name()
-        elif command == 'desc':
-            return self._change_description()
-        elif command == 'add':
-            return self._add()
-        elif command == 'remove':
-            return self._remove()
-        elif command == 'swap':
-            return self._prompt_for_utl_swap()
-        elif command == 'home':
-            return self._swap_home()
-        elif command == 'follow':
-            return self._follow()
-        elif command == 'portrayal':
-            return self._change_portrayal()
-        elif command == 'debug-wizahd':
-            return self._debug_wizahd()
-            
+
+        _, handler = cmd
+        return handler(self)
+
     def display(self):
-        main_comp = self._build_main_component()
-        print(main_comp)
-        print()
+        _, main_comp = self._render()
+        self._write_display(main_comp)
+
+    # noinspection PyMethodMayBeStatic
+    def _write_display(self, main_comp: str):
+        sys.stdout.write(main_comp + '\n\n')
+        sys.stdout.flush()
+
+    def _render(self) -> Tuple[Tuple, str]:
+        """
+        Get the fingerprint of the current state along with the display built
+        for it. The display is only rebuilt when the fingerprint differs from
+        the one it was last built for.
+        """
+        # the snapshot walks the event's universe tree for its addresses, so it is
+        # taken once and used for both the fingerprint and the build
+        snap = self._take_snapshot()
+        fingerprint = self._fingerprint(snap)
+        if self._render_cache is None or self._render_cache[0] != fingerprint:
+            self._render_cache = (fingerprint, self._build_main_component(snap))
+        return self._render_cache
+
+    def _take_snapshot(self) -> _Snapshot:
+        """
+        Read everyfin the display builders need from the wizahd. Several of these
+        are properties that copy or compute their value, so they are read once here
+        rather than by each builder that uses them.
+        """
+        w = self.w
+        event = w.current_event
+        return _Snapshot(
+            work=w.work,
+            portrayal=event.portrayed_in,
+            following=w.following,
+            universe=w.universe,
+            timeline=w.timeline,
+            location=w.location,
+            name=event.name,
+            description=event.description,
+            tags=list(event.tags),
+            items=w.items,
+            characters=w.characters,
+            addresses=event.all_addresses(),
+        )
+
+    # noinspection PyMethodMayBeStatic
+    def _fingerprint(self, snap: _Snapshot) -> Tuple:
+        """
+        Get a value that is equal for two snapshots only if the display built
+        from each would be the same.
+        """
+        return (
+            snap.work,
+            str(snap.portrayal),
+            snap.following,
+            snap.universe,
+            snap.timeline,
+            snap.location,
+            snap.name,
+            snap.description,
+            tuple(str(t) for t in snap.tags),
+            snap.items,
+            snap.characters,
+            tuple(str(a) for a in snap.addresses),
+        )
 
     # noinspection PyMethodMayBeStatic
     def input_command(self) -> Optional[str]:
-        cmd = input("--> ")
-        cmd = format.remove_ansi_escapes(cmd)
-        cmd = cmd.strip().lower()
-        if cmd == "":
-            return None
-        else:
-            return cmd
+        cmd = format.remove_ansi_escapes(input("--> "))
+        return cmd.strip().lower() or None
+
+    def _cmd_exit(self) -> bool:
+        self.running = False
+        return False
+
+    def _cmd_help(self) -> bool:
+        self._show_help(App.HELP)
+        return False
+
+    def _cmd_show(self) -> bool:
+        self.display()
+        return False
 
     def _debug_wizahd(self) -> bool:
         print(self.w.pretty_str())
@@ -166,19 +347,15 @@ class App:
             print("Cancelled UTL swap")
             return False
 
-        prompt_for_univ = prompt_for_tl = prompt_for_loc = False
         new_loc = new_tl = new_univ = None
 
-        for ch in type_requested.lower().replace(' ', ''):
-            if ch not in 'utl':
-                print("Enter some combination of the letters 'U', 'T', and 'L'")
-                return False
-            if ch == 'u':
-                prompt_for_univ = True
-            if ch == 't':
-                prompt_for_tl = True
-            if ch == 'l':
-                prompt_for_loc = True
+        letters = set(type_requested.lower().replace(' ', ''))
+        if not letters <= _utl_letters:
+            print("Enter some combination of the letters 'U', 'T', and 'L'")
+            return False
+        prompt_for_univ = 'u' in letters
+        prompt_for_tl = 't' in letters
+        prompt_for_loc = 'l' in letters
 
         if prompt_for_univ:
             new_univ = input_str("Universe")
@@ -203,17 +380,14 @@ class App:
 
     # noinspection PyMethodMayBeStatic
     def _show_help(self, options: Dict[str, str]):
-        print("Commands:")
-        for command in options:
-            help_text = options[command]
-            print("* {:s} - {:s}".format(command, help_text))
+        lines = ["Commands:"]
+        lines.extend(_help_row(command, help_text) for command, help_text in options.items())
+        print('\n'.join(lines))
 
     def _add(self) -> bool:
-        options = ['universe', 'timeline', 'location', 'item', 'char']
-
         target = input_str("What kind of thing to add").lower()
-        if target not in options:
-            print("Must be one of 'universe', 'timeline', 'location', 'item', or 'char'")
+        if target not in _targets:
+            print(_target_err)
             return False
 
         updated, _ = self._perform_add(target)
@@ -227,149 +401,105 @@ class App:
         :param target:
         :return:
         """
-        if target == 'item' or target == 'char':
-            if self.w.location is None:
-                updated, new_loc = self._perform_add('location')
-                if not updated:
-                    return False, None
-                self._swap(location=new_loc)
-            name = input_str("Name of {:s}".format(target))
-            if name == "":
-                print("Cancelled adding {:s}".format(target))
-                return False, None
-            if target == 'item':
-                self.w.add_item(name)
-            elif target == 'char':
-                self.w.add_char(name)
-            else:
-                raise ValueError("should never happen")
-            return True, name
-        elif target == 'location':
-            if self.w.timeline is None:
-                updated, new_tl = self._perform_add('timeline')
-                if not updated:
-                    return False, None
-                self._swap(timeline=new_tl)
-            name = input_str("Name of location")
-            if name == "":
-                print("Cancelled adding location")
-                return False, None
-            addr = ParadoxAddress(location=name)
-            if self.w.current_event.has_location(addr):
-                print("That location already exists")
+        spec = _add_specs[target]
+        if spec.parent is not None and getattr(self.w, spec.parent) is None:
+            updated, new_parent = self._perform_add(spec.parent)
+            if not updated:
                 return False, None
-            self.w.add_scene(location=name)
-            return True, name
-        elif target == 'timeline':
-            if self.w.universe is None:
-                updated, new_univ = self._perform_add('universe')
-                if not updated:
-                    return False, None
-                self._swap(universe=new_univ)
-            name = input_str("Name of timeline")
-            if name == "":
-                print("Cancelled adding timeline")
-                return False, None
-            addr = ParadoxAddress(location=name)
-            if self.w.current_event.has_timeline(addr):
-                print("That timeline already exists")
-                return False, None
-            self.w.add_scene(timeline=name)
-            return True, name
-        elif target == 'universe':
-            name = input_str("Name of universe")
-            if name == "":
-                print("Cancelled adding universe")
-                return False, None
-            addr = ParadoxAddress(universe=name)
-            if self.w.current_event.has_universe(addr):
-                print("That universe already exists")
-                return False, None
-            self.w.add_scene(universe=name)
-            return True, name
-        else:
-            raise ValueError("should never happen")
+            self._swap(**{spec.parent: new_parent})
+        name = input_str("Name of {:s}".format(target))
+        if name == "":
+            print("Cancelled adding {:s}".format(target))
+            return False, None
+        if spec.exists is not None and spec.exists(self.w.current_event, name):
+            print("That {:s} already exists".format(target))
+            return False, None
+        spec.add(self.w, name)
+        return True, name
 
     def _remove(self) -> bool:
-        options = ['universe', 'timeline', 'location', 'item', 'char']
-
         target = input_str("What kind of thing to remove").lower()
-        if target not in options:
-            print("Must be one of 'universe', 'timeline', 'location', 'item', or 'char'")
+        if target not in _targets:
+            print(_target_err)
             return False
 
-        if target == 'item' or target == 'char':
-            if self.w.location is None:
-                print("Not yet following a location. Add one before removing things from it.")
-                return False
-            name = input_str("Name of {:s}".format(target))
-            if name == "":
-                print("Cancelled removing {:s}".format(target))
-                return False
-            if target == 'item':
-                self.w.remove_item(name)
-            elif target == 'char':
-                self.w.remove_char(name)
-            else:
-                raise ValueError("should never happen")
-            return True
-        elif target == 'location':
-            if self.w.timeline is None:
-                print("Not yet following a timeline. Add one before removing things from it.")
-                return False
-            name = input_str("Name of location")
-            if name == "":
+        return App._REMOVE_HANDLERS[target](self)
+
+    def _remove_inhabitant(self, target: str) -> bool:
+        if self.w.location is None:
+            print("Not yet following a location. Add one before removing things from it.")
+            return False
+        name = input_str("Name of {:s}".format(target))
+        if name == "":
+            print("Cancelled removing {:s}".format(target))
+            return False
+        if target == 'item':
+            self.w.remove_item(name)
+        elif target == 'char':
+            self.w.remove_char(name)
+        else:
+            raise ValueError("should never happen")
+        return True
+
+    def _remove_location(self) -> bool:
+        if self.w.timeline is None:
+            print("Not yet following a timeline. Add one before removing things from it.")
+            return False
+        name = input_str("Name of location")
+        if name == "":
+            print("Cancelled removing location")
+            return False
+        event = self.w.current_event
+        found = event.find_location(ParadoxAddress(location=name))
+        if found is None:
+            print("That location doesn't exist")
+            return False
+        idx, loc = found
+        if len(loc.characters) > 0 or len(loc.items) > 0:
+            if not entry.confirm("This location has items/chars, which will also be deleted. Proceed?"):
                 print("Cancelled removing location")
                 return False
-            addr = ParadoxAddress(location=name)
-            if not self.w.current_event.has_location(addr):
-                print("That location doesn't exist")
-                return False
-            idx = self.w.current_event.universes[0].timelines[0].index_of_location(name)
-            loc = self.w.current_event.universes[0].timelines[0].locations[idx]
-            if len(loc.characters) > 0 or len(loc.items) > 0:
-                if not entry.confirm("This location has items/chars, which will also be deleted. Proceed?"):
-                    print("Cancelled removing location")
-                    return False
-            del self.w.current_event.universes[0].timelines[0].locations[idx]
-            return True
-        elif target == 'timeline':
-            if self.w.universe is None:
-                print("Not yet following a universe. Add one before removing things from it.")
-                return False
-            name = input_str("Name of timeline")
-            if name == "":
+        del event.universes[0].timelines[0].locations[idx]
+        return True
+
+    def _remove_timeline(self) -> bool:
+        if self.w.universe is None:
+            print("Not yet following a universe. Add one before removing things from it.")
+            return False
+        name = input_str("Name of timeline")
+        if name == "":
+            print("Cancelled removing timeline")
+            return False
+        event = self.w.current_event
+        found = event.find_timeline(ParadoxAddress(timeline=name))
+        if found is None:
+            print("That timeline doesn't exist")
+            return False
+        idx, tl = found
+        if len(tl.locations) > 0:
+            if not entry.confirm("This timeline has locations, which will also be deleted. Proceed?"):
                 print("Cancelled removing timeline")
                 return False
-            addr = ParadoxAddress(timeline=name)
-            if not self.w.current_event.has_timeline(addr):
-                print("That timeline doesn't exist")
-                return False
-            idx = self.w.current_event.universes[0].index_of_timeline(name)
-            if len(self.w.current_event.universes[0].timelines[idx].locations) > 0:
-                if not entry.confirm("This timeline has locations, which will also be deleted. Proceed?"):
-                    print("Cancelled removing timeline")
-                    return False
-            del self.w.current_event.universes[0].timelines[0].locations[idx]
-            return True
-        elif target == 'universe':
-            name = input_str("Name of universe")
-            if name == "":
+        del event.universes[0].timelines[idx]
+        return True
+
+    def _remove_universe(self) -> bool:
+        name = input_str("Name of universe")
+        if name == "":
+            print("Cancelled removing universe")
+            return False
+        event = self.w.current_event
+        found = event.find_universe(ParadoxAddress(universe=name))
+        if found is None:
+            print("That universe doesn't exist")
+            return False
+        idx, univ = found
+        if len(univ.timelines) > 0:
+            if not entry.confirm("This universe has timelines, which will also be deleted. Proceed?"):
                 print("Cancelled removing universe")
                 return False
-            addr = ParadoxAddress(universe=name)
-            if not self.w.current_event.has_universe(addr):
-                print("That universe doesn't exist")
-                return False
-            idx = self.w.current_event.index_of_universe(name)
-            if len(self.w.current_event.universes[idx].timelines) > 0:
-                if not entry.confirm("This universe has timelines, which will also be deleted. Proceed?"):
-                    print("Cancelled removing universe")
-                    return False
-            del self.w.current_event.universes[0].timelines[0].locations[idx]
-            return True
-        else:
-            raise ValueError("should never happen")
+        del event.universes[idx]
+        return True
 
     def _swap(self, location: Optional[str] = None, timeline: Optional[str] = None, universe: Optional[str] = None, address: Optional[ParadoxAddress] = None):
         """Change the current UTL."""
@@ -432,160 +562,128 @@ class App:
         print("Current portrayal is {:s}".format(str(self.w.current_event.portrayed_in)))
         print("")
         
-    def _build_main_component(self) -> str:
-        top = self._build_portrayal_and_time_component()
-        left = self._build_main_component_left()
-        right = self._build_main_component_right()
-        mid = format.columns(left, _left_width + 1, right, _right_width + 1, no_lwrap=True)
+    def _build_main_component(self, snap: _Snapshot) -> str:
+        top = self._build_portrayal_and_time_component(snap)
+        left = self._build_main_component_left(snap)
+        right = self._build_main_component_right(snap)
+        mid = _main_columns(left=left, right=right)
 
-        bar = '-' * TotalWidth
+        bar = _total_bar
 
         # universe list goes under everyfin so it can be fully displayed
 
-        bot = self._build_universe_component_text()
-        bot = format.wrap(bot, TotalWidth, extend=True)
-        return bar +'\n' + top + '\n' + bar + '\n' + mid + '\n' + bar + '\n' + bot + '\n' + bar
+        bot = self._build_universe_component_text(snap)
+        bot = _wrap(bot, _layout.total, extend=True)
+        return '\n'.join((bar, top, bar, mid, bar, bot, bar))
 
-    def _build_main_component_left(self) -> str:
-        left_top = self._build_following()
-        right_top = self._build_name_and_description()
+    def _build_main_component_left(self, snap: _Snapshot) -> str:
+        left_top = self._build_following(snap)
+        right_top = self._build_name_and_description(snap)
         
-        top = format.columns(left_top, _following_width + 1, right_top, _name_and_desc_width + 1)
+        top = _upper_left_columns(left=left_top, right=right_top)
 
-        bar = '-' * _left_width
-        bot = self._build_inhabitants_component_text()
-        bot = format.wrap(bot, _left_width, extend=True)
-        return top + '\n' + bar + '\n' + bot
+        bar = _left_bar
+        bot = self._build_inhabitants_component_text(snap)
+        bot = _wrap(bot, _layout.left, extend=True)
+        return '\n'.join((top, bar, bot))
 
-    def _build_main_component_right(self) -> str:
-        return self._build_tags_component_text()
+    def _build_main_component_right(self, snap: _Snapshot) -> str:
+        return self._build_tags_component_text(snap)
         
-    def _build_following(self) -> str:
-        following = self._build_following_component_text()
+    def _build_following(self, snap: _Snapshot) -> str:
+        following = self._build_following_component_text(snap)
         return following
         
-    def _build_name_and_description(self) -> str:
-        name = self._build_name_component_text()
-        bar = '-' * _name_and_desc_width
-        desc = self._build_description_component_text()
-        return name + '\n' + bar + '\n' + desc
+    def _build_name_and_description(self, snap: _Snapshot) -> str:
+        name = self._build_name_component_text(snap)
+        bar = _name_and_desc_bar
+        desc = self._build_description_component_text(snap)
+        return '\n'.join((name, bar, desc))
         
-    def _build_following_component_text(self) -> str:
-        comp = "Following:\n"
-        if self.w.following is None:
-            comp += "(Nobody)"
-        else:
-            comp += self.w.following
-        comp += "\n\n"
-        
-        comp += "In:\n"
-        if self.w.universe is not None:
-            comp += "U:" + self.w.universe + "\n"
-        else:
-            comp += "U: (!) None\n"
-            
-        if self.w.timeline is not None:
-            comp += "T:" + self.w.timeline + "\n"
-        else:
-            comp += "T: (!) None\n"
-            
-        if self.w.location is not None:
-            comp += "L:" + self.w.location + "\n"
-        else:
-            comp += "L: (!) None"
-        
-        return comp
+    # noinspection PyMethodMayBeStatic
+    def _build_following_component_text(self, snap: _Snapshot) -> str:
+        following = snap.following
+        parts = ["Following:", "(Nobody)" if following is None else following, "", "In:"]
+        utl = (("U:", snap.universe), ("T:", snap.timeline), ("L:", snap.location))
+        parts.extend(label + value if value is not None else label + " (!) None" for label, value in utl)
+        if snap.location is not None:
+            parts.append("")
+        return '\n'.join(parts)
         
-    def _build_universe_component_text(self) -> str:
-        comp = "Universes (UTLs):"
+    # noinspection PyMethodMayBeStatic
+    def _build_universe_component_text(self, snap: _Snapshot) -> str:
+        lines = ["Universes (UTLs):"]
+        current = (snap.universe, snap.timeline, snap.location)
         
-        for addr in self.w.current_event.all_addresses():
-            univ_line = '\n'
-            if self.w.universe == addr.universe and self.w.timeline == addr.timeline and self.w.location == addr.location:
-                univ_line += '* '
-            else:
-                univ_line += '  '
-
-            univ_line += '{:s} : {:s} : {:s}'.format(addr.universe, addr.timeline, addr.location)
-            comp += univ_line
-
-        if len(self.w.current_event.all_addresses()) < 1:
-            univ_line = '\n* '
-            if self.w.universe is None:
-                univ_line += "(!)None"
-            else:
-                univ_line += self.w.universe
-            univ_line += ' : '
-            if self.w.timeline is None:
-                univ_line += "(!)None"
-            else:
-                univ_line += self.w.timeline
-            univ_line += ' : '
-            if self.w.location is None:
-                univ_line += "(!)None"
-            else:
-                univ_line += self.w.location
-            comp += univ_line
+        for addr in snap.addresses:
+            utl = (addr.universe, addr.timeline, addr.location)
+            marker = '* ' if utl == current else '  '
+            lines.append(marker + '{:s} : {:s} : {:s}'.format(*utl))
+
+        if not snap.addresses:
+            univ = "(!)None" if snap.universe is None else snap.universe
+            tl = "(!)None" if snap.timeline is None else snap.timeline
+            loc = "(!)None" if snap.location is None else snap.location
+            lines.append('* ' + univ + ' : ' + tl + ' : ' + loc)
             
-        return comp
+        return '\n'.join(lines)
         
-    def _build_name_component_text(self) -> str:
-        comp = "Name: {:s}".format(str(self.w.current_event.name))
+    # noinspection PyMethodMayBeStatic
+    def _build_name_component_text(self, snap: _Snapshot) -> str:
+        comp = "Name: {:s}".format(str(snap.name))
         return comp
         
-    def _build_description_component_text(self) -> str:
-        comp = str(self.w.current_event.description)
+    # noinspection PyMethodMayBeStatic
+    def _build_description_component_text(self, snap: _Snapshot) -> str:
+        comp = str(snap.description)
         return comp
         
-    def _build_tags_component_text(self) -> str:
-        comp = "Tags:"
-        for t in self.w.current_event.tags:
-            comp += "\n* {:s}".format(str(t))
-        return comp
+    # noinspection PyMethodMayBeStatic
+    def _build_tags_component_text(self, snap: _Snapshot) -> str:
+        lines = ["Tags:"]
+        lines.extend("* {:s}".format(str(t)) for t in snap.tags)
+        return '\n'.join(lines)
         
-    def _build_inhabitants_component_text(self) -> str:
-        comp = "Items: "
-        comp += ', '.join(self.w.items)
-        comp += '\n'
-        comp += 'Chars: '
-        comp += ', '.join(self.w.characters)
-        return comp
+    # noinspection PyMethodMayBeStatic
+    def _build_inhabitants_component_text(self, snap: _Snapshot) -> str:
+        items_line = "Items: " + ', '.join(snap.items)
+        chars_line = "Chars: " + ', '.join(snap.characters)
+        return items_line + '\n' + chars_line
 
-    def _build_portrayal_and_time_component(self) -> str:
-        left = self._build_portrayal_text()
+    def _build_portrayal_and_time_component(self, snap: _Snapshot) -> str:
+        left = self._build_portrayal_text(snap)
         # TODO: add time when we can calculate that
         #  right = self._build_time_text()
-        left = format.wrap(left, TotalWidth, extend=True)
+        left = _wrap(left, _layout.total, extend=True)
         return left
 
-    def _build_portrayal_text(self) -> str:
-        comp = "{:s}, Panel ".format(self.w.work)
-
-        portrayal = self.w.current_event.portrayed_in
-        if portrayal.type == "dialog":
-            comp += "#{:d}".format(portrayal.panel)
-            if portrayal.line != 0:
-                comp += " (DIA Line {:d}".format(portrayal.line)
-                if portrayal.character != "":
-                    comp += " by {:s}".format(portrayal.character)
-                comp += ")"
-            elif portrayal.character != "":
-                comp += " (DIA by {:s})".format(portrayal.character)
-        elif portrayal.type == "narration":
-            comp += "#{:d}".format(portrayal.panel)
-            if portrayal.paragraph != 0:
-                comp += " (NAR para {:d}".format(portrayal.paragraph)
-                if portrayal.sentence != 0:
-                    comp += ", sentence {:d}".format(portrayal.sentence)
-                comp += ")"
-            elif portrayal.sentence != 0:
-                comp += " (NAR sentence {:d})".format(portrayal.sentence)
-        elif portrayal.type == "media":
-            comp += "#{:d} (MEDIA".format(portrayal.panel)
-            if portrayal.timestamp != "":
-                comp += " @{:s}".format(portrayal.timestamp)
-            comp += ")"
-        elif portrayal.type == "commentary":
-            comp += "(COMMENTARY v{:s}p{:s})".format(portrayal.volume, portrayal.page)
-
-        return comp
+    # noinspection PyMethodMayBeStatic
+    def _build_portrayal_text(self, snap: _Snapshot) -> str:
+        fmt = _portrayal_formats.get(snap.portrayal.type)
+        detail = fmt(snap.portrayal) if fmt is not None else ""
+        return "{:s}, Panel ".format(snap.work) + detail
+
+    # built at the end of the class body so every handler is already defined
+    _COMMANDS = {
+        'exit': ("Exit the Wizahd", _cmd_exit),
+        'help': ("Show this help", _cmd_help),
+        'show': ("Re-print the current event display", _cmd_show),
+        'name': ("Re-name the current event", _change_name),
+        'desc': ("Give new description for current event", _change_description),
+        'add': ("Manually add universes and their items to the event", _add),
+        'remove': ("Manually remove universes and their contents from the event", _remove),
+        'swap': ("Switch to a different UTL. The followed char does not come with", _prompt_for_utl_swap),
+        'home': ("Return to the UTL that the followed character is in", _swap_home),
+        'follow': ("Set the current narrative main character", _follow),
+        'portrayal': ("Set the panel or commentary that event is portrayed in", _change_portrayal),
+        'debug-wizahd': ("Get a full print-out of the wizahd", _debug_wizahd),
+    }
+    HELP = {command: help_text for command, (help_text, _) in _COMMANDS.items()}
+
+    _REMOVE_HANDLERS = {
+        'item': functools.partial(_remove_inhabitant, target='item'),
+        'char': functools.partial(_remove_inhabitant, target='char'),
+        'location': _remove_location,
+        'timeline': _remove_timeline,
+        'universe': _remove_universe,
+    }
@@ -1,6 +1,8 @@
 from typing import Any
 
 class GenericVar:
+    __slots__ = ('value',)
+
     def __init__(self, value: Any = None):
         self.value = value
         
@@ -1,10 +1,47 @@
 from .events import Event, Tag, Citation, Constraint, Universe, Timeline, Location, ParadoxAddress
 
 from .format import pretty_sequence
-from typing import List, Optional
+from typing import Iterable, List, Optional, Dict, Tuple
+
+
+# constraint type used to link a new event to the previous one, by narrative link
+_narrative_constraint_types = {
+    "causal": "narrative_causal",
+    "immediate": "narrative_immediate",
+}
+
+_char_missing_msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
+_item_missing_msg = (
+    "item {!r} is not yet in this event in the same place as {!r}. Add it manually or give an event that adds one."
+)
+_item_present_msg = (
+    "item {!r} is already in this event in the same place as {!r}. Remove it manually or give an event that "
+    "removes one."
+)
+_result_present_msg = (
+    "result item {!r} is already in this event in the same place as {!r}. Remove it manually or give an event "
+    "that removes it."
+)
 
 
 class Wizahd:
+    __slots__ = (
+        'updated',
+        '_cursor',
+        '_events',
+        '_universe',
+        '_timeline',
+        '_location',
+        '_items',
+        '_chars',
+        '_comic_page',
+        '_work',
+        '_narrative_link',
+        '_following',
+        '_convo_participants',
+        '_locality_index',
+    )
+
     def __init__(self, events: List[Event]):
         self.updated = False
     
@@ -22,7 +59,7 @@ class Wizahd:
         self._narrative_link = "causal"
         self._following = None
 
-        self._convo_participants = dict()
+        self._convo_participants: Dict[str, ParadoxAddress] = dict()
         
         if len(self._events) < 1:
             p = Citation("narration", work=self._work, panel=self._comic_page)
@@ -30,6 +67,11 @@ class Wizahd:
             new_event = Event(portrayed_in=p, constraints=[c])
             self._events.append(new_event)
 
+        # (universe, timeline, location) -> index of the last event that has it
+        self._locality_index: Dict[Tuple[str, str, str], int] = {}
+        for idx in range(len(self._events)):
+            self._index_localities(idx)
+
         self.goto(len(self._events) - 1)
 
     def pretty_str(self, tabs=0) -> str:
@@ -52,21 +94,10 @@ class Wizahd:
         return s
 
     def obtain_item(self, item: str, char: Optional[str] = None):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
+        char, char_addr, char_loc = self._require_char(char)
 
-        char_loc = self.current_event.get_location(char_addr)
         if item not in char_loc.items:
-            msg = "item {!r} is not yet in this event in the same place as {!r}."
-            msg += "Add it manually or give an event that adds one."
-            raise ValueError(msg.format(item, char))
+            raise ValueError(_item_missing_msg.format(item, char))
 
         self.add_char_item_interaction("char_obtains_item", char, item)
 
@@ -77,21 +108,10 @@ class Wizahd:
         self.updated = True
 
     def drop_item(self, item: str, char: Optional[str] = None):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
+        char, char_addr, char_loc = self._require_char(char)
 
-        char_loc = self.current_event.get_location(char_addr)
         if item in char_loc.items:
-            msg = "item {!r} is already in this event in the same place as {!r}."
-            msg += "Remove it manually or give an event that removes one."
-            raise ValueError(msg.format(item, char))
+            raise ValueError(_item_present_msg.format(item, char))
 
         self.add_char_item_interaction("char_drops_item", char, item)
 
@@ -102,17 +122,7 @@ class Wizahd:
         self.updated = True
 
     def use_item(self, item: str, consumed: bool, char: Optional[str] = None):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
-
-        char_loc = self.current_event.get_location(char_addr)
+        char, char_addr, char_loc = self._require_char(char)
 
         self.add_char_item_interaction("char_uses_item", char, item, consumed=consumed)
 
@@ -124,24 +134,11 @@ class Wizahd:
         self.updated = True
 
     def give_item(self, item: str, to_char: str, char: Optional[str] = None):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
-
-        to_char_addr = self.current_event.address_of(to_char)
-        if to_char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(to_char))
+        char, char_addr, char_loc = self._require_char(char)
+        self._require_char(to_char)
 
         self.add_char_item_interaction("char_gives_item_to_char", char, item, target=to_char)
 
-        char_loc = self.current_event.get_location(char_addr)
         if item in char_loc.items:
             char_loc.items.remove(item)
             if char_addr.all_indices_equal(0):
@@ -156,27 +153,18 @@ class Wizahd:
             sylladex_results: List[str],
             char: Optional[str] = None
     ):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
+        char, char_addr, char_loc = self._require_char(char)
 
-        char_loc = self.current_event.get_location(char_addr)
+        at_root = char_addr.all_indices_equal(0)
+        sylladex_set = set(sylladex_results)
         for item in items:
             if item not in char_loc.items:
                 pass
                 # dont disallow this, the char may be using items in inventory and we arent yet tracking inventory
                 # so no way to check atm
         for result in results:
-            if result in char_loc.items and result not in sylladex_results:
-                msg = "result item {!r} is already in this event in the same place as {!r}."
-                msg += "Remove it manually or give an event that removes it."
-                raise ValueError(msg.format(result, char))
+            if result in char_loc.items and result not in sylladex_set:
+                raise ValueError(_result_present_msg.format(result, char))
 
         self.add_char_item_interaction(
             "item_merged",
@@ -186,16 +174,13 @@ class Wizahd:
             sylladex_results=sylladex_results
         )
 
-        for item in items:
-            if item in char_loc.items:
-                char_loc.items.remove(item)
-                if char_addr.all_indices_equal(0):
-                    self._items.remove(item)
-        for result in results:
-            if result not in char_loc.items and result not in sylladex_results:
-                char_loc.items.add(result)
-                if char_addr.all_indices_equal(0):
-                    self._items.add(result)
+        used = char_loc.items.intersection(items)
+        char_loc.items -= used
+        created = set(results) - sylladex_set - char_loc.items
+        char_loc.items |= created
+        if at_root:
+            self._items -= used
+            self._items |= created
             
         self.updated = True
 
@@ -206,27 +191,18 @@ class Wizahd:
             sylladex_results: List[str],
             char: Optional[str] = None
     ):
-        if self._following is None and char is None:
-            raise ValueError("Not following any char yet")
-        if char is None:
-            char = self._following
-
-        char_addr = self.current_event.address_of(char)
-        if char_addr is None:
-            msg = "character {!r} is not yet in this event. Add them manually or give an entrance event"
-            raise ValueError(msg.format(char))
+        char, char_addr, char_loc = self._require_char(char)
 
-        char_loc = self.current_event.get_location(char_addr)
+        at_root = char_addr.all_indices_equal(0)
+        sylladex_set = set(sylladex_results)
         for item in items:
             if item not in char_loc.items:
                 pass
                 # dont disallow this, the char may be using items in inventory and we arent yet tracking inventory
                 # so no way to check atm
         for result in results:
-            if result in char_loc.items and result not in sylladex_results:
-                msg = "result item {!r} is already in this event in the same place as {!r}."
-                msg += "Remove it manually or give an event that removes it."
-                raise ValueError(msg.format(result, char))
+            if result in char_loc.items and result not in sylladex_set:
+                raise ValueError(_result_present_msg.format(result, char))
 
         self.add_char_item_interaction(
             "item_split",
@@ -236,16 +212,13 @@ class Wizahd:
             sylladex_results=sylladex_results
         )
 
-        for item in items:
-            if item in char_loc.items:
-                char_loc.items.remove(item)
-                if char_addr.all_indices_equal(0):
-                    self._items.remove(item)
-        for result in results:
-            if result not in char_loc.items and result not in sylladex_results:
-                char_loc.items.add(result)
-                if char_addr.all_indices_equal(0):
-                    self._items.add(result)
+        used = char_loc.items.intersection(items)
+        char_loc.items -= used
+        created = set(results) - sylladex_set - char_loc.items
+        char_loc.items |= created
+        if at_root:
+            self._items -= used
+            self._items |= created
             
         self.updated = True
 
@@ -259,10 +232,10 @@ class Wizahd:
             raise ValueError("Not following any char yet")
 
         self._convo_participants = {}
-        self.advance_narrative(to_panel, for_dialog=True)
-        self.current_event.portrayed_in = Citation('dialog', work=self._work, panel=self._comic_page)
-        self.current_event.meta.add('convo')
-        address = self.current_event.address_of(self._following)
+        event = self.advance_narrative(to_panel, for_dialog=True)
+        event.portrayed_in = Citation('dialog', work=self._work, panel=self._comic_page)
+        event.meta.add('convo')
+        address = event.address_of(self._following)
         if address is None:
             msg = "Followed char {!r} not present in current event. This should never happen."
             raise ValueError(msg.format(self._following))
@@ -288,11 +261,11 @@ class Wizahd:
         if "convo" not in self.current_event.meta:
             raise ValueError("Not yet in convo")
 
-        self.advance_narrative(to_panel, for_dialog=True)
-        self.current_event.meta.add('convo')
+        event = self.advance_narrative(to_panel, for_dialog=True)
+        event.meta.add('convo')
 
-        for participant in self._convo_participants:
-            addr = self._convo_participants[participant]
+        # every participant is already registered, so re-adding them doesn't resize the dict mid-loop
+        for participant, addr in self._convo_participants.items():
             self.mc_add_convo_participant(participant, addr)
             
         self.updated = True
@@ -309,29 +282,30 @@ class Wizahd:
         self.updated = True
             
     def mc_add_convo_participant(self, char: str, address: ParadoxAddress):
-        if "convo" not in self.current_event.meta:
+        event = self.current_event
+        if "convo" not in event.meta:
             raise ValueError("Can't add a participant, not yet in convo")
 
-        if char not in self._convo_participants:
-            self._convo_participants[char] = address
+        self._convo_participants.setdefault(char, address)
         
-        loc = self.current_event.get_location(address)
+        loc = event.get_location(address)
         if loc is None:
             loc = Location(path=address.location)
-            tl = self.current_event.get_timeline(address)
+            tl = event.get_timeline(address)
             if tl is None:
                 tl = Timeline(path=address.timeline)
-                univ = self.current_event.get_universe(address)
+                univ = event.get_universe(address)
                 if univ is None:
                     univ = Universe(name=address.universe)
-                    self.current_event.universes.append(univ)
+                    event.universes.append(univ)
                 univ.timelines.append(tl)
             tl.locations.append(loc)
+            self._index_localities(self._cursor)
         
         if char not in loc.characters:
             loc.characters.add(char)
 
-        self.current_event.meta.add('convo:' + str(char))
+        event.meta.add('convo:' + char)
             
         self.updated = True
         
@@ -339,11 +313,11 @@ class Wizahd:
         if self._following is None:
             raise ValueError("Not following any char yet")
         
-        self.advance_narrative(to_panel)
-        self.add_char_exit()
-        self.advance_narrative(to_panel)
+        exit_event = self.advance_narrative(to_panel)
+        self.add_char_exit(event=exit_event)
+        enter_event = self.advance_narrative(to_panel)
         self.scene_change(new_loc)
-        self.add_char_enter()
+        self.add_char_enter(event=enter_event)
             
         self.updated = True
 
@@ -357,45 +331,19 @@ class Wizahd:
             result_items: List[str] = None,
             sylladex_results: List[str] = None
     ):
-        if interaction_type not in [
-            "char_obtains_item",
-            "char_drops_item",
-            "char_uses_item",
-            "char_gives_item_to_char",
-            "item_merged",
-            "item_split"
-        ]:
+        build_tag_args = _item_tag_arg_builders.get(interaction_type)
+        if build_tag_args is None:
             raise ValueError("not a valid item interaction type: {!r}".format(interaction_type))
 
-        if source_items is None:
-            source_items = list()
-        if result_items is None:
-            result_items = list()
-        if sylladex_results is None:
-            sylladex_results = list()
-
-        tag_args = {
-            "actor": actor,
-        }
-
-        if interaction_type in ['char_obtains_item', 'char_drops_item', 'char_uses_item', 'char_gives_item_to_char']:
-            tag_args['item'] = item
-        elif interaction_type in ['item_split', 'item_merged']:
-            tag_args['source_items'] = list(source_items)
-            tag_args['result_items'] = list(result_items)
-            tag_args['results_in_sylladex'] = list(sylladex_results)
-
-        if interaction_type == "char_uses_item":
-            tag_args['consumed'] = consumed
-        elif interaction_type == "char_gives_item_to_char":
-            tag_args['target'] = target
-
+        tag_args = build_tag_args(actor, item, target, consumed, source_items, result_items, sylladex_results)
         t = Tag(interaction_type, **tag_args)
         self.current_event.tags.append(t)
             
         self.updated = True
 
-    def add_char_exit(self, from_loc=None, char=None):
+    def add_char_exit(self, from_loc=None, char=None, event: Optional[Event] = None):
+        if event is None:
+            event = self.current_event
         if from_loc is None:
             from_loc = self._location
             
@@ -404,12 +352,14 @@ class Wizahd:
                 raise ValueError("No char specified but not following any char either")
             char = self._following
         
-        exit_tag = Tag("char_exits_location", character=char, location=from_loc)
-        self.current_event.tags.append(exit_tag)
+        exit_tag = Tag.char_exits(char, from_loc)
+        event.tags.append(exit_tag)
             
         self.updated = True
         
-    def add_char_enter(self, to_loc=None, char=None):
+    def add_char_enter(self, to_loc=None, char=None, event: Optional[Event] = None):
+        if event is None:
+            event = self.current_event
         if to_loc is None:
             to_loc = self._location
             
@@ -418,8 +368,8 @@ class Wizahd:
                 raise ValueError("No char specified but not following any char either")
             char = self._following
         
-        enter_tag = Tag("char_enters_location", character=char, location=to_loc)
-        self.current_event.tags.append(enter_tag)
+        enter_tag = Tag.char_enters(char, to_loc)
+        event.tags.append(enter_tag)
             
         self.updated = True
 
@@ -429,13 +379,20 @@ class Wizahd:
 
         :param item: The item to add.
         """
+        self.add_items((item,))
+
+    def add_items(self, items: Iterable[str]):
+        """
+        Manually add several items to this event.
+
+        :param items: The items to add.
+        """
         if self._universe is None or self._timeline is None or self._location is None:
             raise ValueError("Need to follow UTL before adding item")
 
-        if item in self._items:
-            return
-        self._items.add(item)
-        self.current_event.universes[0].timelines[0].locations[0].items.add(item)
+        new_items = set(items) - self._items
+        self._items |= new_items
+        self.current_event.universes[0].timelines[0].locations[0].items |= new_items
 
     def add_char(self, char: str):
         """
@@ -443,13 +400,20 @@ class Wizahd:
 
         :param char: The char to add.
         """
+        self.add_chars((char,))
+
+    def add_chars(self, chars: Iterable[str]):
+        """
+        Manually add several characters to this event.
+
+        :param chars: The chars to add.
+        """
         if self._universe is None or self._timeline is None or self._location is None:
             raise ValueError("Need to follow UTL before adding char")
 
-        if char in self._chars:
-            return
-        self._chars.add(char)
-        self.current_event.universes[0].timelines[0].locations[0].characters.add(char)
+        new_chars = set(chars) - self._chars
+        self._chars |= new_chars
+        self.current_event.universes[0].timelines[0].locations[0].characters |= new_chars
 
     def remove_item(self, item: str):
         """
@@ -457,13 +421,20 @@ class Wizahd:
 
         :param item: The item to remove.
         """
+        self.remove_items((item,))
+
+    def remove_items(self, items: Iterable[str]):
+        """
+        Manually remove several items from this event.
+
+        :param items: The items to remove.
+        """
         if self._universe is None or self._timeline is None or self._location is None:
             raise ValueError("Need to follow UTL before removing item")
 
-        if item not in self._items:
-            return
-        self._items.remove(item)
-        self.current_event.universes[0].timelines[0].locations[0].items.remove(item)
+        gone = self._items.intersection(items)
+        self._items -= gone
+        self.current_event.universes[0].timelines[0].locations[0].items -= gone
 
     def remove_char(self, char: str):
         """
@@ -471,13 +442,20 @@ class Wizahd:
 
         :param char: The char to remove.
         """
+        self.remove_chars((char,))
+
+    def remove_chars(self, chars: Iterable[str]):
+        """
+        Manually remove several characters from this event.
+
+        :param chars: The chars to remove.
+        """
         if self._universe is None or self._timeline is None or self._location is None:
             raise ValueError("Need to follow UTL before removing char")
 
-        if char not in self._chars:
-            return
-        self._chars.remove(char)
-        self.current_event.universes[0].timelines[0].locations[0].characters.remove(char)
+        gone = self._chars.intersection(chars)
+        self._chars -= gone
+        self.current_event.universes[0].timelines[0].locations[0].characters -= gone
         
     def get_last_event(self, address: Optional[ParadoxAddress] = None) -> Event:
         """
@@ -502,24 +480,51 @@ class Wizahd:
         if univ is None:
             univ = self._universe
             
-        found_event = None
-        for evt in reversed(self._events):
-            for u in evt.universes:
-                if u.name == univ:
-                    for tl in u.timelines:
-                        if tl.path == timeline:
-                            for loc in tl.locations:
-                                if loc.path == location:
-                                    found_event = evt
-                                    break
-                            if found_event is not None:
-                                break
-                    if found_event is not None:
-                        break
-            if found_event is not None:
-                break
-        
-        return found_event
+        key = (univ, timeline, location)
+        idx = self._locality_index.get(key)
+        if idx is None:
+            return None
+        if _has_locality(self._events[idx], *key):
+            return self._events[idx]
+
+        # the locality was removed from that event after it was indexed, so find
+        # the one before it that still has it
+        events = self._events
+        idx = next((i for i in range(idx - 1, -1, -1) if _has_locality(events[i], *key)), None)
+        if idx is None:
+            del self._locality_index[key]
+            return None
+        self._locality_index[key] = idx
+        return events[idx]
+
+    def _require_char(self, char: Optional[str]) -> Tuple[str, ParadoxAddress, Location]:
+        """
+        Get the given char, or the followed one if none is given, along with their address and location in the
+        current event. Raise ValueError if there is no such char or they are not in the event.
+        """
+        if char is None:
+            if self._following is None:
+                raise ValueError("Not following any char yet")
+            char = self._following
+
+        event = self.current_event
+        char_addr = event.address_of(char)
+        if char_addr is None:
+            raise ValueError(_char_missing_msg.format(char))
+        return char, char_addr, event.get_location(char_addr)
+
+    def _index_localities(self, event_idx: int):
+        """
+        Record every locality in the event at the given index in the locality index. Must be called whenever a
+        locality is added to or renamed in an event.
+        """
+        index = self._locality_index
+        for u in self._events[event_idx].universes:
+            for tl in u.timelines:
+                for loc in tl.locations:
+                    key = (u.name, tl.path, loc.path)
+                    if index.get(key, -1) < event_idx:
+                        index[key] = event_idx
 
     def add_scene(self, location=None, timeline=None, universe=None):
         """
@@ -615,19 +620,30 @@ class Wizahd:
             self.updated = True
             if len(self.current_event.universes) == 1:
                 self._universe = u.name
+        if new_loc or new_tl or new_univ:
+            self._index_localities(self._cursor)
 
-    def carry_over_scene(self, address: ParadoxAddress):
-        scene = self.current_event.get_location(address)
+    def carry_over_scene(self, address: ParadoxAddress) -> bool:
+        """
+        Bring the items and characters present at the end of the last event at the given scene into the current
+        event. Return whether there was a last event to carry them over from.
+        """
+        event = self.current_event
+        scene = event.get_location(address)
         if scene is None:
             raise ValueError("Scene does not yet exist in this event: {!r}".format(address))
 
         last_event = self.get_last_event(address)
         if last_event is not None:
+            # scene_at_end builds a new Location every time, so its sets can be taken as-is
             loc_at_end = last_event.scene_at_end(address)
-            self._items = set(loc_at_end.items)
-            self._chars = set(loc_at_end.characters)
-            self.current_event.universes[0].timelines[0].locations[0].characters.extend(loc_at_end.characters)
-            self.current_event.universes[0].timelines[0].locations[0].items.extend(loc_at_end.items)
+            self._items = loc_at_end.items
+            self._chars = loc_at_end.characters
+            cur_loc = event.universes[0].timelines[0].locations[0]
+            cur_loc.characters |= loc_at_end.characters
+            cur_loc.items |= loc_at_end.items
+            return True
+        return False
 
     def swap_scene(self, address: ParadoxAddress):
         address = address.copy()
@@ -702,6 +718,12 @@ class Wizahd:
         in the Event instead of being replaced with the new one.
         """
         
+        same_tl = new_timeline is None or new_timeline == self._timeline
+        same_univ = new_universe is None or new_universe == self._universe
+        if new_location == self._location and same_tl and same_univ:
+            # we are already here. no need to change anyfin
+            return
+
         if new_timeline is not None:
             dest_timeline = new_timeline
         else:
@@ -712,38 +734,54 @@ class Wizahd:
         else:
             dest_universe = self._universe
             
-        if self._universe == dest_universe and self._timeline == dest_timeline and self._location == new_location:
-            # we are already here. no need to change anyfin
-            return
-            
+        event = self.current_event
+        # the list the new scene was put in front of, if any
+        preserved_in = None
         if preserve:
+            # the current scene stays as it is and the new one is put in front of it, so only the new
+            # scene needs building rather than a copy of everyfin in the current one
+            cur_univ = event.universes[0]
+            new_loc = Location(path=new_location)
             if dest_universe != self._universe:
-                cur_univ = self.current_event.universes[0]
-                self.current_event.universes.append(cur_univ.copy())
+                new_tl = Timeline(path=dest_timeline, locations=[new_loc])
+                preserved_in, new_scene = event.universes, Universe(name=dest_universe, timelines=[new_tl])
             elif dest_timeline != self._timeline:
-                cur_timeline = self.current_event.universes[0].timelines[0]
-                self.current_event.universes[0].timelines.append(cur_timeline.copy())
-            elif new_location != self._location:
-                cur_location = self.current_event.universes[0].timelines[0].locations[0]
-                self.current_event.universes[0].timelines[0].locations.append(cur_location.copy())
+                preserved_in, new_scene = cur_univ.timelines, Timeline(path=dest_timeline, locations=[new_loc])
+            else:
+                preserved_in, new_scene = cur_univ.timelines[0].locations, new_loc
+            preserved_in.insert(0, new_scene)
         
-        self._items = set()
-        self._chars = set()
-
         dest_address = ParadoxAddress(location=new_location, timeline=dest_timeline, universe=dest_universe)
-        self.carry_over_scene(dest_address)
-        
+        try:
+            carried_over = self.carry_over_scene(dest_address)
+        except ValueError:
+            # take the new scene back out so the event is left as it was
+            if preserved_in is not None:
+                del preserved_in[0]
+            raise
+
+        if not carried_over:
+            # nofin happened here before, so the scene starts out empty
+            self._items = set()
+            self._chars = set()
+        
+        # carrying over the scene doesn't reorder anyfin, so the current UTL can be
+        # looked up once for all three renames
+        cur_univ = event.universes[0]
+        cur_timeline = cur_univ.timelines[0]
+
         self._location = new_location
-        self.current_event.universes[0].timelines[0].locations[0].path = new_location
+        cur_timeline.locations[0].path = new_location
         
         if new_timeline is not None:
             self._timeline = new_timeline
-            self.current_event.universes[0].timelines[0].path = new_timeline
+            cur_timeline.path = new_timeline
             
         if new_universe is not None:
             self._universe = new_universe
-            self.current_event.universes[0].name = new_universe
-            
+            cur_univ.name = new_universe
+
+        self._index_localities(self._cursor)
         self.updated = True
         
     def next(self):
@@ -753,19 +791,20 @@ class Wizahd:
         self.goto(self._cursor - 1)
         
     def goto(self, cursor: int):
-        if cursor < 0:
-            raise ValueError("cursor needs to be >= 0")
-        if cursor >= len(self._events):
+        if not 0 <= cursor < len(self._events):
+            if cursor < 0:
+                raise ValueError("cursor needs to be >= 0")
             raise ValueError("cursor bigger than number of events")
             
         self._cursor = cursor
         
-        event = self.current_event
+        event = self._events[cursor]
 
         self._convo_participants = {}
         
-        self._work = event.portrayed_in.work
-        self._comic_page = event.portrayed_in.panel
+        portrayal = event.portrayed_in
+        self._work = portrayal.work
+        self._comic_page = portrayal.panel
                
         self._universe = None
         self._timeline = None
@@ -773,13 +812,16 @@ class Wizahd:
         self._items = set()
         self._chars = set()
         if len(event.universes) > 0:
-            self._universe = event.universes[0].name
-            if len(event.universes[0].timelines) > 0:
-                self._timeline = event.universes[0].timelines[0].path
-                if len(event.universes[0].timelines[0].locations) > 0:
-                    self._location = event.universes[0].timelines[0].locations[0].path
-                    self._items = set(event.universes[0].timelines[0].locations[0].items)
-                    self._chars = set(event.universes[0].timelines[0].locations[0].characters)
+            univ = event.universes[0]
+            self._universe = univ.name
+            if len(univ.timelines) > 0:
+                tl = univ.timelines[0]
+                self._timeline = tl.path
+                if len(tl.locations) > 0:
+                    loc = tl.locations[0]
+                    self._location = loc.path
+                    self._items = set(loc.items)
+                    self._chars = set(loc.characters)
 
         if "convo" in event.meta:
             for m in event.meta:
@@ -790,15 +832,19 @@ class Wizahd:
                         raise ValueError("char {!r} is in convo but is not included in event universes".format(char))
                     self._convo_participants[char] = char_addr
         
-    def advance_narrative(self, to_panel=0, for_dialog=False):
+    def advance_narrative(self, to_panel=0, for_dialog=False) -> Event:
+        """
+        Add a new event after the last one in the history and make it the current one. Return the new event.
+        """
         if self._comic_page > to_panel:
             raise ValueError("advance needs to happen after the current for a narrative")
             
-        if 0 < to_panel != self._comic_page + 1:
+        next_page = self._comic_page + 1
+        if 0 < to_panel != next_page:
             self._comic_page = to_panel
             self._narrative_link = "causal"
         else:
-            self._comic_page += 1
+            self._comic_page = next_page
             self._narrative_link = "immediate"
     
         self._cursor = len(self._events)
@@ -809,16 +855,20 @@ class Wizahd:
             self._convo_participants = {}
             portrayal = Citation("narration", work=self._work, panel=self._comic_page)
 
-        last_page_id = self._events[self._cursor - 1].id if self._cursor >= 1 else None
-        last_page_link = Constraint("narrative_" + self._narrative_link, ref_event=last_page_id, is_after=True)
+        # the new event links back to whichever is currently last in the history
+        last_page_id = self._events[-1].id if self._events else None
+        link_type = _narrative_constraint_types[self._narrative_link]
+        last_page_link = Constraint(link_type, ref_event=last_page_id, is_after=True)
         loc = Location(path=self._location, characters=self._chars, items=self._items)
         tl = Timeline(path=self._timeline, locations=[loc])
-        univ = Universe(path=self._universe, timelines=[tl])
+        univ = Universe(name=self._universe, timelines=[tl])
         
         new_event = Event(portrayed_in=portrayal, constraints=[last_page_link], universes=[univ])
         self._events.append(new_event)
+        self._index_localities(self._cursor)
             
         self.updated = True
+        return new_event
         
     def copy_events(self) -> List[Event]:
         return list(self._events)
@@ -878,6 +928,7 @@ class Wizahd:
     def universe(self, value: str):
         self._universe = value
         self.current_event.universes[0].name = value
+        self._index_localities(self._cursor)
             
         self.updated = True
         
@@ -889,6 +940,7 @@ class Wizahd:
     def timeline(self, value: str):
         self._timeline = value
         self.current_event.universes[0].timelines[0].path = value
+        self._index_localities(self._cursor)
             
         self.updated = True
         
@@ -900,6 +952,7 @@ class Wizahd:
     def location(self, value: str):
         self._location = value
         self.current_event.universes[0].timelines[0].locations[0].path = value
+        self._index_localities(self._cursor)
             
         self.updated = True
         
@@ -913,9 +966,54 @@ class Wizahd:
         self.current_event.portrayed_in.panel = value
     
     @property
-    def items(self) -> List[str]:
-        return list(self._items)
+    def items(self) -> Tuple[str, ...]:
+        return tuple(self._items)
         
     @property
-    def characters(self) -> List[str]:
-        return list(self._chars)
+    def characters(self) -> Tuple[str, ...]:
+        return tuple(self._chars)
+
+
+def _has_locality(event: Event, univ: str, timeline: str, location: str) -> bool:
+    """Return whether the event has the given location in the given timeline and universe."""
+    return any(
+        loc.path == location
+        for u in event.universes if u.name == univ
+        for tl in u.timelines if tl.path == timeline
+        for loc in tl.locations
+    )
+
+
+# the item interaction tag builders below all take the same arguments as add_char_item_interaction and give the
+# kwargs for the Tag of their type
+
+def _item_tag_args(actor, item, target, consumed, source_items, result_items, sylladex_results) -> Dict:
+    return {"actor": actor, "item": item}
+
+
+def _use_item_tag_args(actor, item, target, consumed, source_items, result_items, sylladex_results) -> Dict:
+    return {"actor": actor, "item": item, "consumed": consumed}
+
+
+def _give_item_tag_args(actor, item, target, consumed, source_items, result_items, sylladex_results) -> Dict:
+    return {"actor": actor, "item": item, "target": target}
+
+
+def _multi_item_tag_args(actor, item, target, consumed, source_items, result_items, sylladex_results) -> Dict:
+    # Tag copies these into lists of its own
+    return {
+        "actor": actor,
+        "source_items": source_items or (),
+        "result_items": result_items or (),
+        "results_in_sylladex": sylladex_results or (),
+    }
+
+
+_item_tag_arg_builders = {
+    "char_obtains_item": _item_tag_args,
+    "char_drops_item": _item_tag_args,
+    "char_uses_item": _use_item_tag_args,
+    "char_gives_item_to_char": _give_item_tag_args,
+    "item_merged": _multi_item_tag_args,
+    "item_split": _multi_item_tag_args,
+}